@@ -1,12 +1,15 @@
 """The SystemAIR integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .coordinator import SystemairUpdateCoordinator
 from .services import async_setup_services
@@ -22,6 +25,14 @@ PLATFORMS = [
     Platform.NUMBER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the SystemAIR services, shared by all config entries."""
+    await async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SystemAIR from a config entry."""
@@ -36,13 +47,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_load_stored_time_values()
         _LOGGER.debug("Loaded stored mode time values from disk")
     except Exception as err:
-        _LOGGER.warning(f"Failed to load stored time values: {err}")
+        _LOGGER.warning("Failed to load stored time values: %s", err)
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    # Set up services
-    await async_setup_services(hass, entry)
-    
     return True
 
 
@@ -50,29 +58,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    # Save time values to storage before unloading
-    try:
-        await coordinator.async_save_stored_time_values()
-        _LOGGER.debug("Saved mode time values to disk")
-    except Exception as err:
-        _LOGGER.warning(f"Failed to save time values: {err}")
-    
-    # Disconnect the WebSocket if it exists
+    # Save time values to storage and disconnect the WebSocket concurrently,
+    # they are independent of each other
+    jobs = [coordinator.async_save_stored_time_values()]
     if coordinator.websocket:
         _LOGGER.debug("Disconnecting from SystemAIR WebSocket")
-        await hass.async_add_executor_job(coordinator.websocket.disconnect)
+        jobs.append(hass.async_add_executor_job(coordinator.websocket.disconnect))
+    
+    save_result, *disconnect_result = await asyncio.gather(*jobs, return_exceptions=True)
+    if isinstance(save_result, Exception):
+        _LOGGER.warning("Failed to save time values: %s", save_result)
+    else:
+        _LOGGER.debug("Saved mode time values to disk")
+    if disconnect_result and isinstance(disconnect_result[0], Exception):
+        _LOGGER.warning("Failed to disconnect WebSocket: %s", disconnect_result[0])
     
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
-    
-    # Unregister services
-    for service in [
-        "set_user_mode", 
-        "set_manual_airflow", 
-        "set_room_temp_setpoint",
-        "set_user_mode_time"
-    ]:
-        if hass.services.has_service(DOMAIN, service):
-            hass.services.async_remove(DOMAIN, service)
+        await coordinator.async_shutdown()
     
     return unload_ok
\ No newline at end of file
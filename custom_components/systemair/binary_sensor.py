@@ -10,7 +10,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -21,33 +21,34 @@ from .const import DOMAIN
 from .coordinator import SystemairUpdateCoordinator
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class SystemairBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Class describing SystemAIR binary sensor entities."""
 
+    active_key: str | None = None
     value_fn: Callable[[VentilationUnit], bool] = None
 
 
-BINARY_SENSOR_TYPES = [
+BINARY_SENSOR_TYPES = (
     # Active functions
     SystemairBinarySensorEntityDescription(
         key="active_heating",
         name="Heating active",
         device_class=BinarySensorDeviceClass.HEAT,
-        value_fn=lambda unit: unit.active_functions.get('heating', False),
+        active_key="heating",
     ),
     SystemairBinarySensorEntityDescription(
         key="active_cooling",
         name="Cooling active",
         device_class=BinarySensorDeviceClass.COLD,
-        value_fn=lambda unit: unit.active_functions.get('cooling', False),
+        active_key="cooling",
     ),
     SystemairBinarySensorEntityDescription(
         key="active_defrosting",
         name="Defrosting active",
         device_class=BinarySensorDeviceClass.RUNNING,
         icon="mdi:snowflake-melt",
-        value_fn=lambda unit: unit.active_functions.get('defrosting', False),
+        active_key="defrosting",
     ),
     
     # Alarm indicators
@@ -57,7 +58,7 @@ BINARY_SENSOR_TYPES = [
         device_class=BinarySensorDeviceClass.PROBLEM,
         icon="mdi:air-filter",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda unit: unit.get_filter_alarm(),
+        value_fn=VentilationUnit.get_filter_alarm,
     ),
     
     # Other active functions
@@ -65,13 +66,13 @@ BINARY_SENSOR_TYPES = [
         key="eco_mode",
         name="ECO mode active",
         icon="mdi:leaf",
-        value_fn=lambda unit: unit.active_functions.get('eco_mode', False),
+        active_key="eco_mode",
     ),
     SystemairBinarySensorEntityDescription(
         key="free_cooling",
         name="Free cooling active",
         icon="mdi:snowflake",
-        value_fn=lambda unit: unit.active_functions.get('free_cooling', False),
+        active_key="free_cooling",
     ),
     
     # Connection status - using available property from coordinator
@@ -82,7 +83,7 @@ BINARY_SENSOR_TYPES = [
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda unit: True,  # If we can get data, it's connected
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -92,17 +93,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the SystemAIR binary sensor platform."""
     coordinator: SystemairUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-
-    for unit_id, unit in coordinator.units.items():
-        entities.extend(
-            [
-                SystemairBinarySensor(coordinator, unit_id, description)
-                for description in BINARY_SENSOR_TYPES
-            ]
-        )
 
-    async_add_entities(entities)
+    async_add_entities(
+        SystemairBinarySensor(coordinator, unit_id, description)
+        for unit_id in coordinator.units
+        for description in BINARY_SENSOR_TYPES
+    )
 
 
 class SystemairBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -120,21 +116,26 @@ class SystemairBinarySensor(CoordinatorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._unit_id = unit_id
-        self._unit = coordinator.units[unit_id]
-        self._attr_unique_id = f"{unit_id}_{description.key}"
-        self._attr_name = f"{self._unit.name} {description.name}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return the state of the binary sensor."""
-        if self.coordinator.data and self._unit_id in self.coordinator.data:
-            unit = self.coordinator.data[self._unit_id]
-            return self.entity_description.value_fn(unit)
-        return None
\ No newline at end of file
+        self._attr_unique_id = unit_id + "_" + description.key
+        self._attr_name = coordinator.unit_name_by_id[unit_id] + " " + description.name
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
+        self._update_is_on()
+
+    def _update_is_on(self) -> None:
+        """Compute the state of the binary sensor from the coordinator data."""
+        data = self.coordinator.data
+        unit = data.get(self._unit_id) if data else None
+        if unit is None:
+            self._attr_is_on = None
+        elif (active_key := self.entity_description.active_key) is not None:
+            self._attr_is_on = unit.active_functions.get(active_key, False)
+        else:
+            self._attr_is_on = self.entity_description.value_fn(unit)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._unit_id not in self.coordinator.changed_units:
+            return
+        self._update_is_on()
+        super()._handle_coordinator_update()
\ No newline at end of file
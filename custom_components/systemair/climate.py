@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -17,7 +18,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from systemair_api.utils.constants import UserModes
-from .const import DOMAIN, MODE_AUTO, MODE_MANUAL
+from .const import (
+    DOMAIN,
+    DURATION_UNITS,
+    MODE_AUTO,
+    MODE_MANUAL,
+    MODE_TO_DURATION_KEY,
+    convert_duration_to_minutes,
+)
 from .coordinator import SystemairUpdateCoordinator
 from .select import (
     MODE_OPTIONS,
@@ -30,30 +38,33 @@ from .select import (
 _LOGGER = logging.getLogger(__name__)
 
 # Map SystemAIR modes to HA HVAC modes
-SYSTEMAIR_TO_HVAC_MODE = {
+SYSTEMAIR_TO_HVAC_MODE = MappingProxyType({
     UserModes.AUTO: HVACMode.AUTO,
     UserModes.MANUAL: HVACMode.FAN_ONLY,
-}
-HVAC_TO_SYSTEMAIR_MODE = {v: k for k, v in SYSTEMAIR_TO_HVAC_MODE.items()}
+})
+HVAC_TO_SYSTEMAIR_MODE = MappingProxyType({v: k for k, v in SYSTEMAIR_TO_HVAC_MODE.items()})
 
 # Fan mode mapping (lowercase to match HA's conventions)
 FAN_MODES = ["low", "medium", "high"]  # Selectable options
-FAN_MODE_TO_AIRFLOW_LEVEL = {
+FAN_MODE_TO_AIRFLOW_LEVEL = MappingProxyType({
     "low": 2,     # Level 2 = Low
     "medium": 3,  # Level 3 = Normal
     "high": 4,    # Level 4 = High
-}
-AIRFLOW_LEVEL_TO_FAN_MODE = {
+})
+AIRFLOW_LEVEL_TO_FAN_MODE = MappingProxyType({
     1: "off",     # Level 1 = Off (not user selectable)
     2: "low",     # Level 2 = Low
     3: "medium",  # Level 3 = Normal
     4: "high",    # Level 4 = High
     5: "refresh", # Level 5 = Refresh (not user selectable)
-}
+})
+# Indexed by clamped airflow level; index 0 is never used after clamping
+_AIRFLOW_FAN_MODE_BY_LEVEL = ("medium", *AIRFLOW_LEVEL_TO_FAN_MODE.values())
 
 # Preset mode mapping (all operation modes)
 PRESET_MODES = ["auto", "manual", "crowded", "refresh", "fireplace", "away", "holiday"]
-PRESET_MODE_TO_USER_MODE = {
+_PRESET_MODES_SET = frozenset(PRESET_MODES)
+PRESET_MODE_TO_USER_MODE = MappingProxyType({
     "auto": UserModes.AUTO,
     "manual": UserModes.MANUAL,
     "crowded": UserModes.CROWDED,
@@ -61,7 +72,8 @@ PRESET_MODE_TO_USER_MODE = {
     "fireplace": UserModes.FIREPLACE,
     "away": UserModes.AWAY,
     "holiday": UserModes.HOLIDAY,
-}
+})
+_USER_MODE_TO_PRESET = MappingProxyType({v: k for k, v in PRESET_MODE_TO_USER_MODE.items()})
 
 
 async def async_setup_entry(
@@ -100,15 +112,9 @@ class SystemairClimate(CoordinatorEntity, ClimateEntity):
         super().__init__(coordinator)
         self._unit_id = unit_id
         self._unit = coordinator.units[unit_id]
-        self._attr_unique_id = f"{unit_id}_climate"
-        self._attr_name = f"{self._unit.name} Climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
+        self._attr_unique_id = unit_id + "_climate"
+        self._attr_name = coordinator.unit_name_by_id[unit_id] + " Climate"
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
 
     @property
     def current_temperature(self) -> float | None:
@@ -133,42 +139,44 @@ class SystemairClimate(CoordinatorEntity, ClimateEntity):
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode."""
-        # Return the current mode as preset
-        if self._unit.user_mode is not None:
-            # Convert mode value to preset mode name
-            if self._unit.user_mode == UserModes.AUTO:
-                return "auto"
-            elif self._unit.user_mode == UserModes.MANUAL:
-                return "manual"
-            else:
-                mode_name = self._unit.user_mode_name.lower() if self._unit.user_mode_name else None
-                if mode_name in PRESET_MODES:
-                    return mode_name
+        user_mode = self._unit.user_mode
+        if user_mode is None:
+            return PRESET_NONE
+        
+        # Convert mode value to preset mode name
+        if (preset := _USER_MODE_TO_PRESET.get(user_mode)) is not None:
+            return preset
+        mode_name = self._unit.user_mode_name.lower() if self._unit.user_mode_name else None
+        if mode_name in _PRESET_MODES_SET:
+            return mode_name
         return PRESET_NONE
 
     @property
     def fan_mode(self) -> str | None:
         """Return the fan setting."""
-        if self._unit.airflow is not None:
-            level = max(1, min(5, self._unit.airflow))
-            return AIRFLOW_LEVEL_TO_FAN_MODE.get(level, "medium")
-        return "medium"  # Default to medium
+        level = self._unit.airflow
+        if level is None:
+            return "medium"  # Default to medium
+        if level < 1:
+            level = 1
+        elif level > 5:
+            level = 5
+        return _AIRFLOW_FAN_MODE_BY_LEVEL[level]
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set the target temperature."""
         if ATTR_TEMPERATURE in kwargs:
+            temperature = kwargs[ATTR_TEMPERATURE]
+            previous = self._unit.temperatures.get("setpoint")
+            
             # Set temperature and get result
-            result = await self.hass.async_add_executor_job(
-                self.coordinator.set_temperature,
-                self._unit_id,
-                kwargs[ATTR_TEMPERATURE],
-            )
+            result = await self.coordinator.async_set_temperature(self._unit_id, temperature)
             
             # Skip immediate refresh - use optimistic update instead
-            if result:
+            if result and previous != temperature:
                 # Use optimistic update
-                self._unit.temperatures["setpoint"] = kwargs[ATTR_TEMPERATURE]
-                self.async_write_ha_state()
+                self._unit.temperatures["setpoint"] = temperature
+                self.coordinator.async_notify_unit_changed(self._unit_id)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode."""
@@ -177,24 +185,21 @@ class SystemairClimate(CoordinatorEntity, ClimateEntity):
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set the fan mode."""
-        if fan_mode in FAN_MODE_TO_AIRFLOW_LEVEL:
-            level = FAN_MODE_TO_AIRFLOW_LEVEL[fan_mode]
-            _LOGGER.debug(f"Setting fan mode to {fan_mode} (airflow level: {level})")
-            
-            # Set the fan speed and get result
-            result = await self.hass.async_add_executor_job(
-                self.coordinator.set_fan_speed,
-                self._unit_id,
-                level,
-            )
-            
-            # Skip immediate refresh - WebSocket will update soon
-            # Use optimistic update instead
-            if result:
-                # Use optimistic update
-                self.async_write_ha_state()
-        else:
-            _LOGGER.error(f"Invalid fan mode: {fan_mode}")
+        level = FAN_MODE_TO_AIRFLOW_LEVEL.get(fan_mode)
+        if level is None:
+            _LOGGER.error("Invalid fan mode: %s", fan_mode)
+            return
+        
+        _LOGGER.debug("Setting fan mode to %s (airflow level: %s)", fan_mode, level)
+        
+        # Set the fan speed and get result
+        result = await self.coordinator.async_set_fan_speed(self._unit_id, level)
+        
+        # Skip immediate refresh - WebSocket will update soon
+        # Use optimistic update instead
+        if result:
+            # Use optimistic update
+            self.coordinator.async_notify_unit_changed(self._unit_id)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
@@ -203,70 +208,36 @@ class SystemairClimate(CoordinatorEntity, ClimateEntity):
             await self.async_set_hvac_mode(HVACMode.AUTO)
             return
             
-        if preset_mode in PRESET_MODE_TO_USER_MODE:
-            mode_value = PRESET_MODE_TO_USER_MODE[preset_mode]
-            _LOGGER.debug(f"Setting preset mode to {preset_mode} (mode value: {mode_value})")
-            
-            # Get default duration from config if available
-            config_entry = None
-            for entry_id, stored_coordinator in self.hass.data[DOMAIN].items():
-                if self._unit_id in stored_coordinator.units:
-                    config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                    break
-                    
-            time_minutes = None
-            
-            if config_entry:
-                from .const import (
-                    CONF_DURATION_HOLIDAY,
-                    CONF_DURATION_AWAY,
-                    CONF_DURATION_FIREPLACE,
-                    CONF_DURATION_REFRESH,
-                    CONF_DURATION_CROWDED,
-                    convert_duration_to_minutes,
-                )
-                
-                mode_to_duration_config = {
-                    UserModes.HOLIDAY: CONF_DURATION_HOLIDAY,
-                    UserModes.AWAY: CONF_DURATION_AWAY,
-                    UserModes.FIREPLACE: CONF_DURATION_FIREPLACE,
-                    UserModes.REFRESH: CONF_DURATION_REFRESH,
-                    UserModes.CROWDED: CONF_DURATION_CROWDED,
-                }
-                
-                duration_config_key = mode_to_duration_config.get(mode_value)
-                if duration_config_key and duration_config_key in config_entry.data:
-                    config_value = config_entry.data.get(duration_config_key)
-                    time_minutes = convert_duration_to_minutes(duration_config_key, config_value)
-                    _LOGGER.debug(f"Using default duration for {preset_mode} mode: {time_minutes} minutes (from {config_value} {duration_config_key.split('_')[-1]})")
-            
-            # Set the mode with time if available
-            if time_minutes is not None:
-                # Set mode with time and get result
-                result = await self.hass.async_add_executor_job(
-                    self.coordinator.set_mode_with_time,
-                    self._unit_id,
-                    mode_value,
-                    time_minutes,
-                )
-                
-                # Skip immediate refresh - use optimistic update instead
-                if result:
-                    # Use optimistic update
-                    self._unit.user_mode = mode_value
-                    self.async_write_ha_state()
-            else:
-                # Set mode without time and get result
-                result = await self.hass.async_add_executor_job(
-                    self.coordinator.set_mode,
-                    self._unit_id,
-                    mode_value,
-                )
-                
-                # Skip immediate refresh - use optimistic update instead
-                if result:
-                    # Use optimistic update
-                    self._unit.user_mode = mode_value
-                    self.async_write_ha_state()
+        mode_value = PRESET_MODE_TO_USER_MODE.get(preset_mode)
+        if mode_value is None:
+            _LOGGER.error("Invalid preset mode: %s", preset_mode)
+            return
+        
+        _LOGGER.debug("Setting preset mode to %s (mode value: %s)", preset_mode, mode_value)
+        
+        # Get default duration from config if available
+        config_entry = self.coordinator.config_entry
+        time_minutes = None
+        
+        if config_entry:
+            duration_config_key = MODE_TO_DURATION_KEY.get(mode_value)
+            if duration_config_key and duration_config_key in config_entry.data:
+                config_value = config_entry.data.get(duration_config_key)
+                time_minutes = convert_duration_to_minutes(duration_config_key, config_value)
+                _LOGGER.debug("Using default duration for %s mode: %s minutes (from %s %s)", preset_mode, time_minutes, config_value, DURATION_UNITS[duration_config_key])
+        
+        previous_mode = self._unit.user_mode
+        
+        # Set the mode with time if available
+        if time_minutes is not None:
+            # Set mode with time and get result
+            result = await self.coordinator.async_set_mode_with_time(self._unit_id, mode_value, time_minutes)
         else:
-            _LOGGER.error(f"Invalid preset mode: {preset_mode}")
\ No newline at end of file
+            # Set mode without time and get result
+            result = await self.coordinator.async_set_mode(self._unit_id, mode_value)
+        
+        # Skip immediate refresh - use optimistic update instead
+        if result and previous_mode != mode_value:
+            # Use optimistic update
+            self._unit.user_mode = mode_value
+            self.coordinator.async_notify_unit_changed(self._unit_id)
\ No newline at end of file
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import logging
 import hashlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -32,6 +34,7 @@ from .const import (
     DEFAULT_DURATION_CROWDED,
     DEFAULT_BASE_OPERATION_MODE,
     DEFAULT_BASE_AIRFLOW_LEVEL,
+    DURATION_BOUNDS,
     MODE_NAME_TO_VALUE,
     AIRFLOW_LEVEL_TO_VALUE,
     AIRFLOW_LOW,
@@ -41,6 +44,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_MODE_NAMES = tuple(MODE_NAME_TO_VALUE)
+_AIRFLOW_NAMES = (AIRFLOW_LOW, AIRFLOW_NORMAL, AIRFLOW_HIGH)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USERNAME): str,
@@ -48,25 +54,111 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Coerce and range check each duration in one validator
+_DURATION_VALIDATORS = {
+    key: vol.All(vol.Coerce(int), vol.Range(min=low, max=high, msg=message))
+    for key, low, high, message in DURATION_BOUNDS
+}
+
 STEP_DURATIONS_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_DURATION_HOLIDAY, default=DEFAULT_DURATION_HOLIDAY): vol.Coerce(int),    # days
-        vol.Required(CONF_DURATION_AWAY, default=DEFAULT_DURATION_AWAY): vol.Coerce(int),          # hours
-        vol.Required(CONF_DURATION_FIREPLACE, default=DEFAULT_DURATION_FIREPLACE): vol.Coerce(int), # minutes
-        vol.Required(CONF_DURATION_REFRESH, default=DEFAULT_DURATION_REFRESH): vol.Coerce(int),     # minutes
-        vol.Required(CONF_DURATION_CROWDED, default=DEFAULT_DURATION_CROWDED): vol.Coerce(int),      # hours
+        vol.Required(CONF_DURATION_HOLIDAY, default=DEFAULT_DURATION_HOLIDAY): _DURATION_VALIDATORS[CONF_DURATION_HOLIDAY],       # days
+        vol.Required(CONF_DURATION_AWAY, default=DEFAULT_DURATION_AWAY): _DURATION_VALIDATORS[CONF_DURATION_AWAY],                # hours
+        vol.Required(CONF_DURATION_FIREPLACE, default=DEFAULT_DURATION_FIREPLACE): _DURATION_VALIDATORS[CONF_DURATION_FIREPLACE], # minutes
+        vol.Required(CONF_DURATION_REFRESH, default=DEFAULT_DURATION_REFRESH): _DURATION_VALIDATORS[CONF_DURATION_REFRESH],       # minutes
+        vol.Required(CONF_DURATION_CROWDED, default=DEFAULT_DURATION_CROWDED): _DURATION_VALIDATORS[CONF_DURATION_CROWDED],       # hours
     }
 )
 
 STEP_BASE_OPERATION_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_BASE_OPERATION_MODE, default=DEFAULT_BASE_OPERATION_MODE): vol.In(list(MODE_NAME_TO_VALUE.keys())),
-        vol.Required(CONF_BASE_AIRFLOW_LEVEL, default=DEFAULT_BASE_AIRFLOW_LEVEL): vol.In([AIRFLOW_LOW, AIRFLOW_NORMAL, AIRFLOW_HIGH]),
+        vol.Required(CONF_BASE_OPERATION_MODE, default=DEFAULT_BASE_OPERATION_MODE): vol.In(_MODE_NAMES),
+        vol.Required(CONF_BASE_AIRFLOW_LEVEL, default=DEFAULT_BASE_AIRFLOW_LEVEL): vol.In(_AIRFLOW_NAMES),
     }
 )
 
+_DURATIONS_PLACEHOLDERS = {
+    "holiday": f"{DEFAULT_DURATION_HOLIDAY} day(s)",
+    "away": f"{DEFAULT_DURATION_AWAY} hour(s)",
+    "fireplace": f"{DEFAULT_DURATION_FIREPLACE} minutes",
+    "refresh": f"{DEFAULT_DURATION_REFRESH} minutes",
+    "crowded": f"{DEFAULT_DURATION_CROWDED} hour(s)",
+}
+
+_BASE_OP_PLACEHOLDERS = {
+    "note": "Manual mode requires an airflow level. Other modes use automatic airflow control.",
+    "airflow_levels": "Low (25%), Normal (50%), High (75%)",
+}
+
+
+@lru_cache(maxsize=128)
+def _username_unique_id(email: str) -> str:
+    """Return the unique ID for an account, derived from its email."""
+    return hashlib.sha256(email.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+class _DurationsStep:
+    """Durations step shared by the config and options flows."""
+
+    def _durations_schema(self) -> vol.Schema:
+        """Return the schema of the durations form."""
+        return STEP_DURATIONS_DATA_SCHEMA
+
+    async def async_step_durations(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the durations step."""
+        # Ranges are validated by the schema before the input reaches this step
+        if user_input is not None:
+            # Store duration data and proceed to base operation step
+            self.duration_data = user_input
+            return await self.async_step_base_operation()
+            
+        return self.async_show_form(
+            step_id="durations", 
+            data_schema=self._durations_schema(),
+            description_placeholders=_DURATIONS_PLACEHOLDERS,
+        )
+
+
+class _BaseOperationStep(ABC):
+    """Base operation step shared by the config and options flows.
+    
+    Subclasses implement _async_finish to store the validated input.
+    """
+
+    def _base_operation_schema(self) -> vol.Schema:
+        """Return the schema of the base operation form."""
+        return STEP_BASE_OPERATION_DATA_SCHEMA
+
+    @abstractmethod
+    def _async_finish(self, user_input: dict[str, Any]) -> FlowResult:
+        """Finish the flow with the validated base operation input."""
+
+    async def async_step_base_operation(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the base operation step."""
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            # Validate that if manual mode is selected, airflow level is provided
+            if user_input.get(CONF_BASE_OPERATION_MODE) == "manual":
+                if user_input.get(CONF_BASE_AIRFLOW_LEVEL) not in _AIRFLOW_NAMES:
+                    errors[CONF_BASE_AIRFLOW_LEVEL] = "Please select a valid airflow level for manual mode"
+            
+            if not errors:
+                return self._async_finish(user_input)
+        
+        return self.async_show_form(
+            step_id="base_operation",
+            data_schema=self._base_operation_schema(),
+            errors=errors,
+            description_placeholders=_BASE_OP_PLACEHOLDERS,
+        )
+
 
-class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+class ConfigFlow(_DurationsStep, _BaseOperationStep, config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for SystemAIR."""
 
     VERSION = 1
@@ -98,7 +190,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 
                 # Generate a unique ID based on the email
                 # This is used instead of account_id which is not available
-                unique_id = hashlib.sha256(user_input[CONF_USERNAME].encode()).hexdigest()
+                unique_id = _username_unique_id(user_input[CONF_USERNAME])
                 
                 await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
@@ -121,84 +213,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
         
-    async def async_step_durations(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle the durations step."""
-        errors: dict[str, str] = {}
-        
-        if user_input is not None:
-            # Validate ranges manually
-            if user_input.get(CONF_DURATION_HOLIDAY, 0) < 1 or user_input.get(CONF_DURATION_HOLIDAY, 0) > 30:
-                errors[CONF_DURATION_HOLIDAY] = "Holiday duration must be between 1-30 days"
-            if user_input.get(CONF_DURATION_AWAY, 0) < 1 or user_input.get(CONF_DURATION_AWAY, 0) > 24:
-                errors[CONF_DURATION_AWAY] = "Away duration must be between 1-24 hours"
-            if user_input.get(CONF_DURATION_FIREPLACE, 0) < 1 or user_input.get(CONF_DURATION_FIREPLACE, 0) > 120:
-                errors[CONF_DURATION_FIREPLACE] = "Fireplace duration must be between 1-120 minutes"
-            if user_input.get(CONF_DURATION_REFRESH, 0) < 1 or user_input.get(CONF_DURATION_REFRESH, 0) > 120:
-                errors[CONF_DURATION_REFRESH] = "Refresh duration must be between 1-120 minutes"
-            if user_input.get(CONF_DURATION_CROWDED, 0) < 1 or user_input.get(CONF_DURATION_CROWDED, 0) > 12:
-                errors[CONF_DURATION_CROWDED] = "Crowded duration must be between 1-12 hours"
-            
-            if not errors:
-                # Store duration data and proceed to base operation step
-                self.duration_data = user_input
-                return await self.async_step_base_operation()
-            
-        return self.async_show_form(
-            step_id="durations", 
-            data_schema=STEP_DURATIONS_DATA_SCHEMA,
-            errors=errors,
-            description_placeholders={
-                "holiday": f"{DEFAULT_DURATION_HOLIDAY} day(s)",
-                "away": f"{DEFAULT_DURATION_AWAY} hour(s)",
-                "fireplace": f"{DEFAULT_DURATION_FIREPLACE} minutes",
-                "refresh": f"{DEFAULT_DURATION_REFRESH} minutes",
-                "crowded": f"{DEFAULT_DURATION_CROWDED} hour(s)",
-            }
-        )
-
-    async def async_step_base_operation(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle the base operation step."""
-        errors: dict[str, str] = {}
-        
-        if user_input is not None:
-            # Validate that if manual mode is selected, airflow level is provided
-            if user_input.get(CONF_BASE_OPERATION_MODE) == "manual":
-                if user_input.get(CONF_BASE_AIRFLOW_LEVEL) not in [AIRFLOW_LOW, AIRFLOW_NORMAL, AIRFLOW_HIGH]:
-                    errors[CONF_BASE_AIRFLOW_LEVEL] = "Please select a valid airflow level for manual mode"
-            
-            if not errors:
-                # Combine all configuration data
-                data = {
-                    **self.auth_data, 
-                    **self.duration_data, 
-                    **user_input
-                }
-                
-                return self.async_create_entry(
-                    title=self.auth_data[CONF_USERNAME],
-                    data=data,
-                )
-        
-        # Create dynamic schema based on selected mode
-        schema_fields = {
-            vol.Required(CONF_BASE_OPERATION_MODE, default=DEFAULT_BASE_OPERATION_MODE): vol.In(list(MODE_NAME_TO_VALUE.keys())),
+    def _async_finish(self, user_input: dict[str, Any]) -> FlowResult:
+        """Create the config entry from all collected data."""
+        # Combine all configuration data
+        data = {
+            **self.auth_data, 
+            **self.duration_data, 
+            **user_input
         }
         
-        # Add airflow level field only if manual mode might be selected
-        schema_fields[vol.Required(CONF_BASE_AIRFLOW_LEVEL, default=DEFAULT_BASE_AIRFLOW_LEVEL)] = vol.In([AIRFLOW_LOW, AIRFLOW_NORMAL, AIRFLOW_HIGH])
-        
-        return self.async_show_form(
-            step_id="base_operation",
-            data_schema=vol.Schema(schema_fields),
-            errors=errors,
-            description_placeholders={
-                "note": "Manual mode requires an airflow level. Other modes use automatic airflow control.",
-                "airflow_levels": "Low (25%), Normal (50%), High (75%)",
-            }
+        return self.async_create_entry(
+            title=self.auth_data[CONF_USERNAME],
+            data=data,
         )
 
 
@@ -210,7 +236,7 @@ class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
 
 
-class OptionsFlowHandler(config_entries.OptionsFlow):
+class OptionsFlowHandler(_DurationsStep, _BaseOperationStep, config_entries.OptionsFlow):
     """Handle SystemAIR options."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
@@ -223,109 +249,25 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Manage the options."""
         return await self.async_step_durations()
 
-    async def async_step_durations(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle duration options."""
-        errors: dict[str, str] = {}
-        
-        if user_input is not None:
-            # Validate ranges manually
-            if user_input.get(CONF_DURATION_HOLIDAY, 0) < 1 or user_input.get(CONF_DURATION_HOLIDAY, 0) > 30:
-                errors[CONF_DURATION_HOLIDAY] = "Holiday duration must be between 1-30 days"
-            if user_input.get(CONF_DURATION_AWAY, 0) < 1 or user_input.get(CONF_DURATION_AWAY, 0) > 24:
-                errors[CONF_DURATION_AWAY] = "Away duration must be between 1-24 hours"
-            if user_input.get(CONF_DURATION_FIREPLACE, 0) < 1 or user_input.get(CONF_DURATION_FIREPLACE, 0) > 120:
-                errors[CONF_DURATION_FIREPLACE] = "Fireplace duration must be between 1-120 minutes"
-            if user_input.get(CONF_DURATION_REFRESH, 0) < 1 or user_input.get(CONF_DURATION_REFRESH, 0) > 120:
-                errors[CONF_DURATION_REFRESH] = "Refresh duration must be between 1-120 minutes"
-            if user_input.get(CONF_DURATION_CROWDED, 0) < 1 or user_input.get(CONF_DURATION_CROWDED, 0) > 12:
-                errors[CONF_DURATION_CROWDED] = "Crowded duration must be between 1-12 hours"
-            
-            if not errors:
-                # Store duration data and proceed to base operation step
-                self.duration_data = user_input
-                return await self.async_step_base_operation()
-            
-        # Get current values from config entry
-        current_data = self.config_entry.data
-        schema = vol.Schema({
-            vol.Required(
-                CONF_DURATION_HOLIDAY, 
-                default=current_data.get(CONF_DURATION_HOLIDAY, DEFAULT_DURATION_HOLIDAY)
-            ): vol.Coerce(int),
-            vol.Required(
-                CONF_DURATION_AWAY, 
-                default=current_data.get(CONF_DURATION_AWAY, DEFAULT_DURATION_AWAY)
-            ): vol.Coerce(int),
-            vol.Required(
-                CONF_DURATION_FIREPLACE, 
-                default=current_data.get(CONF_DURATION_FIREPLACE, DEFAULT_DURATION_FIREPLACE)
-            ): vol.Coerce(int),
-            vol.Required(
-                CONF_DURATION_REFRESH, 
-                default=current_data.get(CONF_DURATION_REFRESH, DEFAULT_DURATION_REFRESH)
-            ): vol.Coerce(int),
-            vol.Required(
-                CONF_DURATION_CROWDED, 
-                default=current_data.get(CONF_DURATION_CROWDED, DEFAULT_DURATION_CROWDED)
-            ): vol.Coerce(int),
-        })
-            
-        return self.async_show_form(
-            step_id="durations", 
-            data_schema=schema,
-            errors=errors,
-            description_placeholders={
-                "holiday": f"{DEFAULT_DURATION_HOLIDAY} day(s)",
-                "away": f"{DEFAULT_DURATION_AWAY} hour(s)",
-                "fireplace": f"{DEFAULT_DURATION_FIREPLACE} minutes",
-                "refresh": f"{DEFAULT_DURATION_REFRESH} minutes",
-                "crowded": f"{DEFAULT_DURATION_CROWDED} hour(s)",
-            }
+    def _durations_schema(self) -> vol.Schema:
+        """Return the durations schema prefilled with the current values."""
+        return self.add_suggested_values_to_schema(
+            STEP_DURATIONS_DATA_SCHEMA, self.config_entry.data
         )
 
-    async def async_step_base_operation(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle base operation options."""
-        errors: dict[str, str] = {}
-        
-        if user_input is not None:
-            # Validate that if manual mode is selected, airflow level is provided
-            if user_input.get(CONF_BASE_OPERATION_MODE) == "manual":
-                if user_input.get(CONF_BASE_AIRFLOW_LEVEL) not in [AIRFLOW_LOW, AIRFLOW_NORMAL, AIRFLOW_HIGH]:
-                    errors[CONF_BASE_AIRFLOW_LEVEL] = "Please select a valid airflow level for manual mode"
-            
-            if not errors:
-                # Combine all data and update the config entry
-                new_data = {
-                    **self.config_entry.data,
-                    **self.duration_data,
-                    **user_input
-                }
-                
-                return self.async_create_entry(title="", data=new_data)
-        
-        # Get current values from config entry
-        current_data = self.config_entry.data
-        schema_fields = {
-            vol.Required(
-                CONF_BASE_OPERATION_MODE, 
-                default=current_data.get(CONF_BASE_OPERATION_MODE, DEFAULT_BASE_OPERATION_MODE)
-            ): vol.In(list(MODE_NAME_TO_VALUE.keys())),
-            vol.Required(
-                CONF_BASE_AIRFLOW_LEVEL, 
-                default=current_data.get(CONF_BASE_AIRFLOW_LEVEL, DEFAULT_BASE_AIRFLOW_LEVEL)
-            ): vol.In([AIRFLOW_LOW, AIRFLOW_NORMAL, AIRFLOW_HIGH]),
+    def _base_operation_schema(self) -> vol.Schema:
+        """Return the base operation schema prefilled with the current values."""
+        return self.add_suggested_values_to_schema(
+            STEP_BASE_OPERATION_DATA_SCHEMA, self.config_entry.data
+        )
+
+    def _async_finish(self, user_input: dict[str, Any]) -> FlowResult:
+        """Update the config entry with the new options."""
+        # Combine all data and update the config entry
+        new_data = {
+            **self.config_entry.data,
+            **self.duration_data,
+            **user_input
         }
         
-        return self.async_show_form(
-            step_id="base_operation",
-            data_schema=vol.Schema(schema_fields),
-            errors=errors,
-            description_placeholders={
-                "note": "Manual mode requires an airflow level. Other modes use automatic airflow control.",
-                "airflow_levels": "Low (25%), Normal (50%), High (75%)",
-            }
-        )
\ No newline at end of file
+        return self.async_create_entry(title="", data=new_data)
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Constants for the SystemAIR integration."""
+from types import MappingProxyType
 
 DOMAIN = "systemair"
 
@@ -25,6 +26,24 @@ DEFAULT_DURATION_FIREPLACE = 15   # 15 minutes
 DEFAULT_DURATION_REFRESH = 30     # 30 minutes
 DEFAULT_DURATION_CROWDED = 1      # 1 hour
 
+# Natural unit of each duration config value
+DURATION_UNITS = {
+    CONF_DURATION_HOLIDAY: "days",
+    CONF_DURATION_AWAY: "hours",
+    CONF_DURATION_FIREPLACE: "minutes",
+    CONF_DURATION_REFRESH: "minutes",
+    CONF_DURATION_CROWDED: "hours",
+}
+
+# Allowed range and validation error of each duration config value
+DURATION_BOUNDS = (
+    (CONF_DURATION_HOLIDAY, 1, 30, "Holiday duration must be between 1-30 days"),
+    (CONF_DURATION_AWAY, 1, 24, "Away duration must be between 1-24 hours"),
+    (CONF_DURATION_FIREPLACE, 1, 120, "Fireplace duration must be between 1-120 minutes"),
+    (CONF_DURATION_REFRESH, 1, 120, "Refresh duration must be between 1-120 minutes"),
+    (CONF_DURATION_CROWDED, 1, 12, "Crowded duration must be between 1-12 hours"),
+)
+
 # Base operation defaults
 DEFAULT_BASE_OPERATION_MODE = "manual"
 DEFAULT_BASE_AIRFLOW_LEVEL = "normal"
@@ -78,29 +97,27 @@ MODE_NAME_TO_VALUE = {
     "holiday": MODE_HOLIDAY,
 }
 
+# Maps timed user modes to the config key holding their default duration
+MODE_TO_DURATION_KEY = MappingProxyType({
+    MODE_HOLIDAY: CONF_DURATION_HOLIDAY,
+    MODE_AWAY: CONF_DURATION_AWAY,
+    MODE_FIREPLACE: CONF_DURATION_FIREPLACE,
+    MODE_REFRESH: CONF_DURATION_REFRESH,
+    MODE_CROWDED: CONF_DURATION_CROWDED,
+})
+
+# Multiplier converting each duration config value to minutes
+_DURATION_TO_MINUTES_MULT = {
+    CONF_DURATION_HOLIDAY: 24 * 60,  # days to minutes
+    CONF_DURATION_AWAY: 60,          # hours to minutes
+    CONF_DURATION_CROWDED: 60,       # hours to minutes
+    CONF_DURATION_FIREPLACE: 1,      # already in minutes
+    CONF_DURATION_REFRESH: 1,        # already in minutes
+}
+
 def convert_duration_to_minutes(duration_config_key: str, value: int) -> int:
     """Convert duration value to minutes based on the config key.
     
     This is for Home Assistant internal use where we need minutes.
     """
-    if duration_config_key == CONF_DURATION_HOLIDAY:
-        return value * 24 * 60  # days to minutes
-    elif duration_config_key in [CONF_DURATION_AWAY, CONF_DURATION_CROWDED]:
-        return value * 60  # hours to minutes
-    elif duration_config_key in [CONF_DURATION_FIREPLACE, CONF_DURATION_REFRESH]:
-        return value  # already in minutes
-    else:
-        return value  # fallback
-
-def convert_duration_to_api_units(duration_config_key: str, value: int) -> int:
-    """Convert duration value to the units expected by the API registers.
-    
-    API expects:
-    - HOLIDAY: days (REG_MAINBOARD_USERMODE_HOLIDAY_TIME = 251)
-    - AWAY: hours (REG_MAINBOARD_USERMODE_AWAY_TIME = 252) 
-    - FIREPLACE: minutes (REG_MAINBOARD_USERMODE_FIREPLACE_TIME = 253)
-    - REFRESH: minutes (REG_MAINBOARD_USERMODE_REFRESH_TIME = 254)
-    - CROWDED: hours (REG_MAINBOARD_USERMODE_CROWDED_TIME = 255)
-    """
-    # Config values are already in their natural units, which matches what API expects
-    return value
\ No newline at end of file
+    return value * _DURATION_TO_MINUTES_MULT.get(duration_config_key, 1)
\ No newline at end of file
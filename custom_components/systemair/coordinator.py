@@ -2,15 +2,22 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 import json
-import os
 import random
-from datetime import timedelta
-from typing import Any, Dict, Optional
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.storage import Store
 
@@ -18,11 +25,48 @@ from systemair_api import SystemairAPI, SystemairAuthenticator, VentilationUnit
 from systemair_api.api.websocket_client import SystemairWebSocket
 from systemair_api.utils.exceptions import SystemairError, TokenRefreshError, APIError
 from systemair_api.utils.constants import UserModes
+from systemair_api.utils.register_constants import RegisterConstants
 
-from .const import DOMAIN
+from .const import DOMAIN, DURATION_UNITS, MODE_TO_DURATION_KEY, convert_duration_to_minutes
 
 _LOGGER = logging.getLogger(__name__)
-SCAN_INTERVAL = timedelta(seconds=30)
+# The WebSocket pushes state changes, polling only reconciles
+SCAN_INTERVAL = timedelta(minutes=5)
+# Poll more often while the WebSocket is down
+WS_DOWN_SCAN_INTERVAL = timedelta(seconds=60)
+# Consider the WebSocket down when it stayed silent for a whole poll interval
+WS_SILENCE_TIMEOUT = SCAN_INTERVAL.total_seconds()
+# Maximum random delay of the first scheduled poll, in seconds
+FIRST_POLL_JITTER = 15
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+REQUEST_REFRESH_COOLDOWN = 1.0
+RECONCILE_COOLDOWN = 5.0
+TOKEN_REFRESH_MARGIN = 60
+# API requests allowed to run at the same time
+MAX_PARALLEL_REQUESTS = 4
+# Burst size and sustained rate (requests per second) of calls to the SystemAIR API
+API_BURST = 10
+API_RATE = 5 / 60
+
+# Register holding the manual airflow level (1-5)
+_REG_AIRFLOW = RegisterConstants.REG_MAINBOARD_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF
+
+# User modes that run for a limited time, and their key in user_mode_times
+_TIMED_MODES_MASK = (
+    (1 << UserModes.HOLIDAY)
+    | (1 << UserModes.AWAY)
+    | (1 << UserModes.FIREPLACE)
+    | (1 << UserModes.REFRESH)
+    | (1 << UserModes.CROWDED)
+)
+_MODE_KEY = MappingProxyType({
+    UserModes.HOLIDAY: "holiday",
+    UserModes.AWAY: "away",
+    UserModes.FIREPLACE: "fireplace",
+    UserModes.REFRESH: "refresh",
+    UserModes.CROWDED: "crowded",
+})
 
 
 async def retry_with_backoff(func, max_retries=3, base_delay=1, max_delay=60):
@@ -30,31 +74,66 @@ async def retry_with_backoff(func, max_retries=3, base_delay=1, max_delay=60):
     for attempt in range(max_retries + 1):
         try:
             return await func() if asyncio.iscoroutinefunction(func) else func()
+        except TokenRefreshError:
+            # Authentication errors won't go away by retrying
+            raise
         except Exception as ex:
             if attempt == max_retries:
                 raise ex
             
-            # Check for specific errors that shouldn't be retried
-            error_str = str(ex).lower()
-            if "authentication" in error_str or "unauthorized" in error_str:
-                raise ex
-                
-            # Calculate delay with jitter
-            delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
-            
-            # Log specific error types
-            if "server_busy" in error_str or "busy" in error_str:
-                _LOGGER.warning(f"Device busy, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1}): {ex}")
-            elif "500" in error_str or "internal server error" in error_str:
-                _LOGGER.warning(f"Server error, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1}): {ex}")
-            elif "timeout" in error_str:
-                _LOGGER.warning(f"Request timeout, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1}): {ex}")
+            # Classify by type first, only sniff the message of untyped errors
+            status = getattr(ex, "status_code", None) if isinstance(ex, APIError) else None
+            if status is not None:
+                if status in (401, 403):
+                    raise ex
+                reason = "Server error" if status >= 500 else "Request failed"
+            elif isinstance(ex, TimeoutError):
+                reason = "Request timeout"
             else:
-                _LOGGER.warning(f"Request failed, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1}): {ex}")
+                error_str = str(ex).lower()
+                if "authentication" in error_str or "unauthorized" in error_str:
+                    raise ex
+                if "busy" in error_str:
+                    reason = "Device busy"
+                elif "500" in error_str or "internal server error" in error_str:
+                    reason = "Server error"
+                elif "timeout" in error_str:
+                    reason = "Request timeout"
+                else:
+                    reason = "Request failed"
+                
+            # Full jitter, so clients that failed together don't retry together
+            delay = random.uniform(0, min(max_delay, base_delay * (1 << attempt)))
+            _LOGGER.warning("%s, retrying in %.1fs (attempt %s/%s): %s", reason, delay, attempt + 1, max_retries + 1, ex)
             
             await asyncio.sleep(delay)
 
 
+class TokenBucket:
+    """Limit the rate of API calls, allowing short bursts."""
+
+    def __init__(self, capacity: int, rate: float) -> None:
+        """Initialize a full bucket refilled with rate tokens per second."""
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Wait until the tokens are available and take them."""
+        # Waiters are served in order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
 class SystemairUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching SystemAIR data."""
 
@@ -68,304 +147,496 @@ class SystemairUpdateCoordinator(DataUpdateCoordinator):
         )
         self.api = None
         self.websocket = None
+        self._ws_healthy = False
+        # Monotonic time of the last WebSocket message, or of the last connect
+        self._ws_last_message = 0.0
+        self._first_poll = True
+        # WebSocket message handlers by (type, action)
+        self._ws_dispatch = {
+            ("SYSTEM_EVENT", "DEVICE_STATUS_UPDATE"): self._on_ws_device_status,
+        }
         self.units: Dict[str, VentilationUnit] = {}
+        # Unit IDs in discovery order, fixed after setup
+        self._unit_ids: tuple[str, ...] = ()
+        self.device_info_by_unit: Dict[str, Dict[str, Any]] = {}
+        self.unit_name_by_id: Dict[str, str] = {}
         self.available = False
+        self._token_expiry: Optional[float] = None
+        self._update_lock = asyncio.Lock()
+        self._api_sem = asyncio.Semaphore(MAX_PARALLEL_REQUESTS)
+        # API requests run in their own threads, away from the shared executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_PARALLEL_REQUESTS, thread_name_prefix="systemair-api"
+        )
+        self._bucket = TokenBucket(capacity=API_BURST, rate=API_RATE)
+        
+        # Units whose state changed in the last update, entities of other units skip it
+        self.changed_units: set[str] = set()
+        # Update success the entities last saw, every entity updates when it flips
+        self._listeners_update_success = True
+        self._unit_signatures: Dict[str, tuple] = {}
+        # Units whose mode or airflow was set locally and not yet reported by the device
+        self._unconfirmed_units: set[str] = set()
+        
+        # Optional VentilationUnit features, detected once the first unit is created
+        self._has_mode_key_method = False
+        self._has_mode_times_attr = False
+        self._set_user_mode_takes_time = True
         
         # Setup storage for time values
-        self.storage = Store(hass, 1, f"systemair.{entry.entry_id}.time_values")
+        self.storage = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.time_values")
         self._stored_time_values = {}
+        # Units whose time values changed since the last save
+        self._dirty_units: set[str] = set()
         
         super().__init__(
             hass,
             _LOGGER,
             name="SystemAIR",
-            update_interval=SCAN_INTERVAL,
+            update_interval=WS_DOWN_SCAN_INTERVAL,
+            # Collapse bursts of refresh requests into a single API sweep
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+        # Entities read the entry settings through the coordinator
+        self.config_entry = entry
+        # Poll the API once after a burst of WebSocket messages to catch missed state
+        self.reconcile_debouncer = Debouncer(
+            hass, _LOGGER, cooldown=RECONCILE_COOLDOWN, immediate=False, function=self.async_refresh
         )
+        # Unit IDs resolved by the services, dropped when the registries change
+        self.entity_to_unit: Dict[str, str] = {}
+        self._unsub_registry_listeners = [
+            hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated),
+            hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated),
+        ]
 
-    async def _async_update_data(self) -> dict[str, VentilationUnit]:
-        """Fetch data from SystemAIR API."""
+    async def _async_setup(self) -> None:
+        """Authenticate, discover the units and connect the WebSocket.
+        
+        Called once by the first refresh, before the first poll.
+        """
         try:
-            # Authenticate if needed
-            if not self.api:
-                _LOGGER.debug("Authenticating with SystemAIR API")
-                await self.hass.async_add_executor_job(self.authenticator.authenticate)
-                
-                # Create API instance with the access token
-                self.api = SystemairAPI(access_token=self.authenticator.access_token)
-                
-                # Fetch ventilation units
-                devices_response = await self.hass.async_add_executor_job(self.api.get_account_devices)
-                
-                # Process devices into VentilationUnit objects
-                # Debug log the entire response to understand its structure
-                _LOGGER.info(f"API Response: {devices_response}")
-                
-                # Check for errors in the response
-                if 'errors' in devices_response:
-                    _LOGGER.error(f"API returned errors: {devices_response['errors']}")
-                
-                # Try different possible response structures
-                # First try: { "data": { "GetAccountDevices": [ array of devices ] } }
-                # Second try: { "data": { "account": { "devices": [ array of devices ] } } }
-                data = devices_response.get("data", {})
-                
-                # Try to find devices in the response using multiple possible paths
-                devices = None
-                
-                # Try first structure path
-                if "GetAccountDevices" in data:
-                    devices = data.get("GetAccountDevices", [])
-                    _LOGGER.debug("Found devices using path: data.GetAccountDevices")
-                
-                # Try second structure path 
-                elif "account" in data and "devices" in data.get("account", {}):
-                    devices = data.get("account", {}).get("devices", [])
-                    _LOGGER.debug("Found devices using path: data.account.devices")
-                
-                # If still no devices, log details and paths tried
-                if not devices:
-                    devices = []
-                    _LOGGER.warning("No devices found in API response. Data structure might be different than expected.")
-                    _LOGGER.info(f"Response data keys: {data.keys()}")
-                    if "account" in data:
-                        _LOGGER.info(f"Account keys: {data.get('account', {}).keys()}")
-                
-                _LOGGER.info(f"Found devices in API response: {devices}")
+            _LOGGER.debug("Authenticating with SystemAIR API")
+            await self.hass.async_add_executor_job(self.authenticator.authenticate)
+            self._cache_token_expiry()
+            
+            # Create API instance with the access token
+            self.api = SystemairAPI(access_token=self.authenticator.access_token)
+            
+            # Fetch ventilation units
+            new_units = [
+                (device_id, device_name, VentilationUnit(device_id, device_name))
+                for device_id, device_name in await self._async_get_devices()
+            ]
+            
+            if new_units:
+                self._detect_unit_capabilities(new_units[0][2])
+            
+            # Setup WebSocket connection for real-time updates with retry,
+            # it only needs the token so it connects while the statuses are fetched
+            async def connect_websocket():
+                self.websocket = SystemairWebSocket(
+                    access_token=self.authenticator.access_token,
+                    on_message_callback=self._handle_ws_message
+                )
+                return await self.hass.async_add_executor_job(self.websocket.connect)
+            
+            # Start eagerly so the connect job is queued before the status fetches
+            ws_task = self.hass.async_create_task(
+                retry_with_backoff(connect_websocket, max_retries=2, base_delay=2),
+                "systemair websocket connect",
+                eager_start=True,
+            )
+            
+            # Fetch the initial status of all units concurrently
+            statuses = await asyncio.gather(
+                *(self._async_fetch_status(device_id, max_retries=2) for device_id, _, _ in new_units),
+                return_exceptions=True,
+            )
+            for (device_id, device_name, unit), status in zip(new_units, statuses):
+                if isinstance(status, BaseException):
+                    _LOGGER.error("Failed to fetch initial status for %s after retries: %s", device_name, status)
+                else:
+                    unit.update_from_api(status)
                 
-                for device in devices:
-                    # The API might use "identifier" or "id" - try both
-                    device_id = device.get("identifier") or device.get("id")
-                    device_name = device.get("name")
+                # Add to units dictionary
+                self.units[device_id] = unit
+                self.device_info_by_unit[device_id] = self._build_device_info(device_id, unit)
+                self.unit_name_by_id[device_id] = sys.intern(device_name)
+            
+            try:
+                await ws_task
+                _LOGGER.debug("WebSocket connection established")
+                self._set_ws_healthy(True)
+            
+            except Exception as ex:
+                _LOGGER.error("Failed to connect WebSocket after retries: %s", ex)
+            
+            self._unit_ids = tuple(self.units)
+            self.available = True
+            _LOGGER.debug("Found %s ventilation units", len(self.units))
+        
+        except (SystemairError, TokenRefreshError, APIError) as err:
+            self.available = False
+            _LOGGER.error("Error communicating with SystemAIR API: %s", err)
+            raise UpdateFailed(f"Error communicating with SystemAIR API: {err}") from err
+
+    async def _async_update_data(self) -> dict[str, VentilationUnit]:
+        """Fetch the latest status of all units from the SystemAIR API."""
+        # Another refresh is already fetching, let it deliver the data
+        if self._update_lock.locked():
+            self.changed_units = set()
+            return self.units
+        
+        async with self._update_lock:
+            try:
+                # Check if token needs refresh
+                if self._token_needs_refresh():
+                    _LOGGER.debug("Refreshing auth token")
+                    await self.hass.async_add_executor_job(self.authenticator.refresh_access_token)
+                    self._cache_token_expiry()
+                    self.api.update_token(self.authenticator.access_token)
                     
-                    # Log the device details for debugging
-                    _LOGGER.info(f"Device found: ID={device_id}, Name={device_name}, Keys={device.keys()}")
+                    # Hand the new token to the WebSocket if the client supports it
+                    if self.websocket and hasattr(self.websocket, "update_token"):
+                        _LOGGER.debug("Updating WebSocket token")
+                        await self.hass.async_add_executor_job(
+                            self.websocket.update_token, self.authenticator.access_token
+                        )
                     
-                    if device_id and device_name:
-                        # Create VentilationUnit instance
-                        unit = VentilationUnit(device_id, device_name)
+                    # Otherwise recreate the WebSocket connection with the new token
+                    elif self.websocket:
+                        _LOGGER.debug("Reconnecting WebSocket with new token")
+                        self._set_ws_healthy(False)
+                        await self.hass.async_add_executor_job(self.websocket.disconnect)
                         
-                        # Try to get device status with retry
-                        try:
-                            async def fetch_status():
-                                return await self.hass.async_add_executor_job(
-                                    self.api.fetch_device_status, device_id
-                                )
-                            
-                            status = await retry_with_backoff(fetch_status, max_retries=2)
-                            unit.update_from_api(status)
-                        except Exception as ex:
-                            _LOGGER.error(f"Failed to fetch initial status for {device_name} after retries: {ex}")
-                            
-                        # Add to units dictionary
-                        self.units[device_id] = unit
-                
-                # Setup WebSocket connection for real-time updates with retry
-                try:
-                    # Create a callback function to handle websocket messages
-                    def handle_ws_message(message: Dict[str, Any]) -> None:
-                        """Handle incoming WebSocket messages."""
-                        _LOGGER.debug(f"Received WebSocket message: {message}")
-                        
-                        # Check if this is a device status update message
-                        if message.get("action") == "DEVICE_STATUS_UPDATE" and message.get("type") == "SYSTEM_EVENT":
-                            # Extract the device ID from the 'id' field in properties
-                            properties = message.get("properties", {})
-                            device_id = properties.get("id")
-                            
-                            if device_id and device_id in self.units:
-                                _LOGGER.debug(f"Updating unit {device_id} from WebSocket")
-                                self.units[device_id].update_from_websocket(message)
-                                
-                                # Schedule an immediate update through the Home Assistant event loop
-                                # This safely triggers entity updates from the WebSocket data
-                                _LOGGER.debug(f"Unit {device_id} updated from WebSocket, scheduling immediate refresh")
-                                self.hass.loop.call_soon_threadsafe(
-                                    lambda: self.hass.create_task(
-                                        self.async_refresh()
-                                    )
-                                )
-                            elif device_id:
-                                _LOGGER.debug(f"Received update for unknown device ID: {device_id}")
-                        # Check for the original message format too
-                        elif "identifier" in message and message["identifier"] in self.units:
-                            unit_id = message["identifier"]
-                            self.units[unit_id].update_from_websocket(message)
-                            
-                            # Schedule an immediate update through the Home Assistant event loop
-                            # This safely triggers entity updates from the WebSocket data
-                            _LOGGER.debug(f"Unit {unit_id} updated from WebSocket, scheduling immediate refresh")
-                            self.hass.loop.call_soon_threadsafe(
-                                lambda: self.hass.create_task(
-                                    self.async_refresh()
-                                )
-                            )
-                        else:
-                            _LOGGER.debug(f"Received WebSocket message of type: {message.get('type')}, action: {message.get('action')}")
-                    
-                    # Initialize and connect WebSocket with retry
-                    async def connect_websocket():
+                        # Initialize the WebSocket client with the new token
                         self.websocket = SystemairWebSocket(
                             access_token=self.authenticator.access_token,
-                            on_message_callback=handle_ws_message
+                            on_message_callback=self._handle_ws_message
                         )
-                        return await self.hass.async_add_executor_job(self.websocket.connect)
-                    
-                    await retry_with_backoff(connect_websocket, max_retries=2, base_delay=2)
-                    _LOGGER.debug("WebSocket connection established")
-                    
-                except Exception as ex:
-                    _LOGGER.error(f"Failed to connect WebSocket after retries: {ex}")
-                
-                self.available = True
-                _LOGGER.debug(f"Found {len(self.units)} ventilation units")
-                
-            # Check if token needs refresh
-            if not self.authenticator.is_token_valid():
-                _LOGGER.debug("Refreshing auth token")
-                await self.hass.async_add_executor_job(self.authenticator.refresh_access_token)
-                self.api.update_token(self.authenticator.access_token)
-                
-                # If we have a WebSocket connection, recreate it with the new token
-                if self.websocket:
-                    _LOGGER.debug("Reconnecting WebSocket with new token")
-                    await self.hass.async_add_executor_job(self.websocket.disconnect)
-                    
-                    # Initialize the WebSocket client with the new token
-                    def handle_ws_message(message):
-                        """Handle incoming WebSocket messages."""
-                        _LOGGER.debug(f"Received WebSocket message: {message}")
                         
-                        # Check if this is a device status update message
-                        if message.get("action") == "DEVICE_STATUS_UPDATE" and message.get("type") == "SYSTEM_EVENT":
-                            # Extract the device ID from the 'id' field in properties
-                            properties = message.get("properties", {})
-                            device_id = properties.get("id")
-                            
-                            if device_id and device_id in self.units:
-                                _LOGGER.debug(f"Updating unit {device_id} from WebSocket")
-                                self.units[device_id].update_from_websocket(message)
-                                
-                                # Schedule an immediate update through the Home Assistant event loop
-                                # This safely triggers entity updates from the WebSocket data
-                                _LOGGER.debug(f"Unit {device_id} updated from WebSocket, scheduling immediate refresh")
-                                self.hass.loop.call_soon_threadsafe(
-                                    lambda: self.hass.create_task(
-                                        self.async_refresh()
-                                    )
-                                )
-                            elif device_id:
-                                _LOGGER.debug(f"Received update for unknown device ID: {device_id}")
-                        # Check for the original message format too
-                        elif "identifier" in message and message["identifier"] in self.units:
-                            unit_id = message["identifier"]
-                            self.units[unit_id].update_from_websocket(message)
-                            
-                            # Schedule an immediate update through the Home Assistant event loop
-                            # This safely triggers entity updates from the WebSocket data
-                            _LOGGER.debug(f"Unit {unit_id} updated from WebSocket, scheduling immediate refresh")
-                            self.hass.loop.call_soon_threadsafe(
-                                lambda: self.hass.create_task(
-                                    self.async_refresh()
-                                )
-                            )
-                        else:
-                            _LOGGER.debug(f"Received WebSocket message of type: {message.get('type')}, action: {message.get('action')}")
-                    
-                    self.websocket = SystemairWebSocket(
-                        access_token=self.authenticator.access_token,
-                        on_message_callback=handle_ws_message
-                    )
-                    
-                    await self.hass.async_add_executor_job(self.websocket.connect)
-                    _LOGGER.debug("WebSocket reconnected")
+                        await self.hass.async_add_executor_job(self.websocket.connect)
+                        _LOGGER.debug("WebSocket reconnected")
+                        self._set_ws_healthy(True)
                 
-            # Update unit data by fetching latest status with staggered requests
-            for i, (unit_id, unit) in enumerate(self.units.items()):
-                # Add small delay between requests to avoid overwhelming the device
-                if i > 0:
-                    await asyncio.sleep(0.5)
-                    
-                try:
-                    async def fetch_unit_status():
-                        return await self.hass.async_add_executor_job(
-                            self.api.fetch_device_status, unit_id
-                        )
-                    
-                    status = await retry_with_backoff(fetch_unit_status, max_retries=3, base_delay=2)
+                # Update unit data by fetching the latest status of all units concurrently
+                unit_ids = self._unit_ids
+                statuses = await asyncio.gather(
+                    *(self._async_fetch_status(unit_id, max_retries=3, base_delay=2) for unit_id in unit_ids),
+                    return_exceptions=True,
+                )
+                for unit_id, status in zip(unit_ids, statuses):
+                    if isinstance(status, BaseException):
+                        _LOGGER.error("Failed to update unit %s after retries: %s", unit_id, status)
+                        # Don't mark coordinator as unavailable for individual unit failures
+                        continue
+                    unit = self.units[unit_id]
                     unit.update_from_api(status)
-                    _LOGGER.debug(f"Updated unit {unit_id} from API: airflow={unit.airflow}, mode={unit.user_mode}")
-                except Exception as ex:
-                    _LOGGER.error(f"Failed to update unit {unit_id} after retries: {ex}")
-                    # Don't mark coordinator as unavailable for individual unit failures
-                    continue
+                    self._unconfirmed_units.discard(unit_id)
+                    _LOGGER.debug("Updated unit %s from API: airflow=%s, mode=%s", unit_id, unit.airflow, unit.user_mode)
+                
+                self._update_changed_units(unit_ids)
+                # A closed or stalled socket reports nothing, poll often until it speaks again
+                if self._ws_healthy and time.monotonic() - self._ws_last_message > WS_SILENCE_TIMEOUT:
+                    _LOGGER.debug("No WebSocket message for %s seconds", WS_SILENCE_TIMEOUT)
+                    self._set_ws_healthy(False)
+                if self._first_poll:
+                    # Offset the schedule so coordinators started together don't poll in lockstep
+                    self._first_poll = False
+                    self.update_interval += timedelta(seconds=random.uniform(0, FIRST_POLL_JITTER))
+                else:
+                    self.update_interval = SCAN_INTERVAL if self._ws_healthy else WS_DOWN_SCAN_INTERVAL
+                
+                # Return the unit data, entities only read from it
+                return self.units
             
-            # Return a dictionary with the unit data
-            return {unit_id: unit for unit_id, unit in self.units.items()}
+            except (SystemairError, TokenRefreshError, APIError) as err:
+                self.available = False
+                _LOGGER.error("Error communicating with SystemAIR API: %s", err)
+                raise UpdateFailed(f"Error communicating with SystemAIR API: {err}") from err
+
+    @staticmethod
+    def _unit_signature(unit: VentilationUnit) -> tuple:
+        """Return the unit state read by the entities."""
+        temperatures = unit.temperatures
+        return (
+            unit.airflow,
+            unit.user_mode,
+            unit.user_mode_name,
+            getattr(unit, "user_mode_remaining_time", None),
+            unit.temperature,
+            temperatures.get("setpoint"),
+            temperatures.get("oat"),
+            temperatures.get("sat"),
+            unit.humidity,
+            unit.air_quality,
+            unit.get_filter_alarm(),
+            tuple(unit.active_functions.items()),
+        )
+    
+    def _update_changed_units(self, unit_ids: Iterable[str]) -> None:
+        """Record which of the given units changed state since they were last seen."""
+        # Entities become available again after a failed update, refresh all of them
+        recovered = not self.last_update_success
+        changed = set()
+        for unit_id in unit_ids:
+            signature = self._unit_signature(self.units[unit_id])
+            if recovered or self._unit_signatures.get(unit_id) != signature:
+                self._unit_signatures[unit_id] = signature
+                changed.add(unit_id)
+        self.changed_units = changed
+
+    async def _async_get_devices(self) -> list[tuple[str, str]]:
+        """Return the ID and name of the account's units."""
+        await self._bucket.acquire()
+        devices_response = await self._run(self.api.get_account_devices)
+        return self._parse_devices(devices_response)
+    
+    @staticmethod
+    def _parse_devices(devices_response: Dict[str, Any]) -> list[tuple[str, str]]:
+        """Extract the ID and name of each unit from the account devices response."""
+        # Debug log the entire response to understand its structure
+        _LOGGER.debug("API Response: %s", devices_response)
         
-        except (SystemairError, TokenRefreshError, APIError) as err:
-            self.available = False
-            _LOGGER.error(f"Error communicating with SystemAIR API: {err}")
-            raise UpdateFailed(f"Error communicating with SystemAIR API: {err}") from err
+        # Check for errors in the response
+        if 'errors' in devices_response:
+            _LOGGER.error("API returned errors: %s", devices_response['errors'])
+        
+        # Try different possible response structures
+        # First try: { "data": { "GetAccountDevices": [ array of devices ] } }
+        # Second try: { "data": { "account": { "devices": [ array of devices ] } } }
+        data = devices_response.get("data", {})
+        account = data.get("account")
+        
+        # Try to find devices in the response using multiple possible paths
+        devices = None
+        
+        # Try first structure path
+        if "GetAccountDevices" in data:
+            devices = data.get("GetAccountDevices", [])
+            _LOGGER.debug("Found devices using path: data.GetAccountDevices")
+        
+        # Try second structure path 
+        elif account and "devices" in account:
+            devices = account["devices"]
+            _LOGGER.debug("Found devices using path: data.account.devices")
+        
+        # If still no devices, log details and paths tried
+        if not devices:
+            devices = []
+            _LOGGER.warning("No devices found in API response. Data structure might be different than expected.")
+            _LOGGER.debug("Response data keys: %s", data.keys())
+            if account is not None:
+                _LOGGER.debug("Account keys: %s", account.keys())
+        
+        _LOGGER.debug("Found devices in API response: %s", devices)
+        
+        found = []
+        for device in devices:
+            # The API might use "identifier" or "id" - try both
+            device_id = device.get("identifier") or device.get("id")
+            device_name = device.get("name")
+        
+            # Log the device details for debugging
+            _LOGGER.debug("Device found: ID=%s, Name=%s, Keys=%s", device_id, device_name, device.keys())
+        
+            if device_id and device_name:
+                found.append((device_id, device_name))
+        
+        return found
+    
+    def _detect_unit_capabilities(self, unit: VentilationUnit) -> None:
+        """Detect which optional features the installed VentilationUnit provides."""
+        self._has_mode_key_method = hasattr(unit, "get_mode_name_for_key")
+        self._has_mode_times_attr = hasattr(unit, "user_mode_times")
+        try:
+            parameters = inspect.signature(unit.set_user_mode).parameters
+        except (TypeError, ValueError):
+            # Signature not introspectable, assume the current API
+            self._set_user_mode_takes_time = True
+        else:
+            # Bound method: api, mode and the optional time
+            self._set_user_mode_takes_time = len(parameters) >= 3
+    
+    def _cache_token_expiry(self) -> None:
+        """Remember when the access token expires as a monotonic timestamp."""
+        expiry = getattr(self.authenticator, "token_expiry", None)
+        if isinstance(expiry, datetime):
+            remaining = (expiry - datetime.now(expiry.tzinfo)).total_seconds()
+            self._token_expiry = time.monotonic() + remaining
+        else:
+            self._token_expiry = None
+    
+    def _token_needs_refresh(self) -> bool:
+        """Return True if the access token is about to expire."""
+        if self._token_expiry is None:
+            # Expiry unknown, ask the authenticator
+            return not self.authenticator.is_token_valid()
+        return time.monotonic() >= self._token_expiry - TOKEN_REFRESH_MARGIN
+    
+    def _handle_ws_message(self, message: Dict[str, Any]) -> None:
+        """Handle incoming WebSocket messages.
+        
+        Called from the WebSocket client thread.
+        """
+        self._ws_last_message = time.monotonic()
+        _LOGGER.debug("Received WebSocket message: %s", message)
+        
+        handler = self._ws_dispatch.get((message.get("type"), message.get("action")))
+        if handler is not None:
+            handler(message)
+            return
+        
+        # Check for the original message format too
+        device_id = message.get("identifier")
+        if device_id in self.units:
+            self._apply_ws_update(device_id, message)
+        else:
+            _LOGGER.debug("Received WebSocket message of type: %s, action: %s", message.get("type"), message.get("action"))
+    
+    def _on_ws_device_status(self, message: Dict[str, Any]) -> None:
+        """Handle a DEVICE_STATUS_UPDATE system event."""
+        # Extract the device ID from the 'id' field in properties
+        props = message.get("properties")
+        device_id = props.get("id") if props else None
+        if device_id in self.units:
+            self._apply_ws_update(device_id, message)
+        elif device_id:
+            _LOGGER.debug("Received update for unknown device ID: %s", device_id)
+    
+    def _apply_ws_update(self, device_id: str, message: Dict[str, Any]) -> None:
+        """Apply a WebSocket message to its unit."""
+        self.units[device_id].update_from_websocket(message)
+        
+        # Push the WebSocket data to the entities through the Home Assistant event loop
+        # The message carries the new state, so no API poll is needed
+        _LOGGER.debug("Unit %s updated from WebSocket, notifying entities", device_id)
+        self.hass.loop.call_soon_threadsafe(self._async_push_websocket_update, device_id)
+    
+    @callback
+    def _async_push_websocket_update(self, unit_id: str) -> None:
+        """Notify entities of unit state received over the WebSocket."""
+        self._unconfirmed_units.discard(unit_id)
+        self._update_changed_units((unit_id,))
+        if self.changed_units:
+            self.async_set_updated_data(self.units)
+        self.reconcile_debouncer.async_schedule_call()
+        self._set_ws_healthy(True)
+    
+    def _set_ws_healthy(self, healthy: bool) -> None:
+        """Poll rarely while the WebSocket delivers updates, and often while it doesn't."""
+        if healthy == self._ws_healthy:
+            return
+        self._ws_healthy = healthy
+        if healthy:
+            # Give a fresh connection a full interval to deliver its first message
+            self._ws_last_message = time.monotonic()
+        self.update_interval = SCAN_INTERVAL if healthy else WS_DOWN_SCAN_INTERVAL
+        _LOGGER.debug("WebSocket %s, polling every %s", "up" if healthy else "down", self.update_interval)
+    
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners, all units changed when the availability flipped."""
+        # Any failed update or recovery has to reach every entity, whatever the error was
+        if self.last_update_success != self._listeners_update_success:
+            self._listeners_update_success = self.last_update_success
+            self.changed_units = set(self.units)
+        super().async_update_listeners()
+    
+    @callback
+    def async_notify_unit_changed(self, unit_id: str) -> None:
+        """Let all entities of a unit show an optimistic state change at once."""
+        self.changed_units = {unit_id}
+        self.async_update_listeners()
+    
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Forget the cached unit of a removed or renamed entity."""
+        self.entity_to_unit.pop(event.data["entity_id"], None)
+        if old_entity_id := event.data.get("old_entity_id"):
+            self.entity_to_unit.pop(old_entity_id, None)
+    
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Forget all cached units, a device may have changed its identifiers."""
+        self.entity_to_unit.clear()
     
-    def set_mode(self, unit_id: str, mode: int) -> bool:
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh and stop the API threads."""
+        await super().async_shutdown()
+        self.reconcile_debouncer.async_shutdown()
+        for unsub in self._unsub_registry_listeners:
+            unsub()
+        self._unsub_registry_listeners.clear()
+        self._executor.shutdown(wait=False)
+    
+    def _run(self, func: Callable[..., Any], *args: Any) -> asyncio.Future[Any]:
+        """Run a blocking API call in the integration's executor."""
+        return self.hass.loop.run_in_executor(self._executor, func, *args)
+    
+    async def _async_fetch_status(
+        self, unit_id: str, max_retries: int, base_delay: float = 1
+    ) -> Dict[str, Any]:
+        """Fetch the status of a unit, retrying with backoff on failure."""
+        async def fetch_status():
+            # Don't flood the shared executor when there are many units
+            async with self._api_sem:
+                await self._bucket.acquire()
+                return await self._run(
+                    self.api.fetch_device_status, unit_id
+                )
+        
+        return await retry_with_backoff(fetch_status, max_retries=max_retries, base_delay=base_delay)
+    
+    @staticmethod
+    def _build_device_info(unit_id: str, unit: VentilationUnit) -> Dict[str, Any]:
+        """Build the device info shared by all entities of a unit."""
+        return {
+            "identifiers": {(DOMAIN, unit_id)},
+            "name": unit.name,
+            "manufacturer": "Systemair",
+            "model": unit.model or "Systemair Ventilation Unit",
+            "sw_version": next((v.get("version") for v in unit.versions if v.get("type") == "SW"), None),
+        }
+
+    async def async_set_mode(self, unit_id: str, mode: int) -> bool:
         """Set the operation mode.
         
-        For timed modes, this will use set_mode_with_time to ensure time values are sent.
+        For timed modes, this will use async_set_mode_with_time to ensure time values are sent.
         
         Returns:
             bool: True if successful, False otherwise
         """
-        from systemair_api.utils.constants import UserModes
-        
-        # For timed modes, use set_mode_with_time to ensure time registers are set
-        timed_modes = {UserModes.HOLIDAY, UserModes.AWAY, UserModes.FIREPLACE, UserModes.REFRESH, UserModes.CROWDED}
-        
-        if mode in timed_modes:
-            # Use set_mode_with_time which will handle time values automatically
-            return self.set_mode_with_time(unit_id, mode, None)
+        # For timed modes, use async_set_mode_with_time to ensure time registers are set
+        if (_TIMED_MODES_MASK >> mode) & 1:
+            # Use async_set_mode_with_time which will handle time values automatically
+            return await self.async_set_mode_with_time(unit_id, mode, None)
         else:
             # For non-timed modes (AUTO, MANUAL), use direct mode setting with retry
             unit = self.units.get(unit_id)
             if unit and self.api:
+                async def set_user_mode():
+                    await self._bucket.acquire()
+                    return await self._run(
+                        unit.set_user_mode, self.api, mode
+                    )
+                
                 try:
-                    def set_mode():
-                        return unit.set_user_mode(self.api, mode)
-                    
-                    # Use sync version of retry since this method isn't async
-                    for attempt in range(4):  # 3 retries + initial attempt
-                        try:
-                            result = set_mode()
-                            if result:
-                                # Update local state for optimistic updates
-                                unit.user_mode = mode
-                            return result
-                        except Exception as ex:
-                            if attempt == 3:  # Final attempt
-                                raise ex
-                            
-                            error_str = str(ex).lower()
-                            if "authentication" in error_str or "unauthorized" in error_str:
-                                raise ex
-                                
-                            delay = min(1 * (2 ** attempt) + random.uniform(0, 0.5), 30)
-                            
-                            if "server_busy" in error_str or "busy" in error_str:
-                                _LOGGER.warning(f"Device busy setting mode, retrying in {delay:.1f}s (attempt {attempt + 1}/4): {ex}")
-                            elif "500" in error_str or "internal server error" in error_str:
-                                _LOGGER.warning(f"Server error setting mode, retrying in {delay:.1f}s (attempt {attempt + 1}/4): {ex}")
-                            elif "timeout" in error_str:
-                                _LOGGER.warning(f"Timeout setting mode, retrying in {delay:.1f}s (attempt {attempt + 1}/4): {ex}")
-                            else:
-                                _LOGGER.warning(f"Failed to set mode, retrying in {delay:.1f}s (attempt {attempt + 1}/4): {ex}")
-                            
-                            import time
-                            time.sleep(delay)
-                            
+                    # Wait between attempts on the event loop, not in an executor thread
+                    result = await retry_with_backoff(set_user_mode, max_retries=3, base_delay=1, max_delay=30)
+                    if result:
+                        # Update local state for optimistic updates
+                        unit.user_mode = mode
+                        self._unconfirmed_units.add(unit_id)
+                    return result
                 except Exception as err:
-                    _LOGGER.error(f"Failed to set mode after retries: {err}")
+                    _LOGGER.error("Failed to set mode after retries: %s", err)
             return False
                 
-    def set_mode_with_time(self, unit_id: str, mode: int, time_minutes: Optional[int] = None) -> bool:
+    async def async_set_mode_with_time(self, unit_id: str, mode: int, time_minutes: Optional[int] = None) -> bool:
         """Set the operation mode with an optional time duration.
         
         If time_minutes is not provided, it will use the stored value for the mode.
@@ -383,105 +654,81 @@ class SystemairUpdateCoordinator(DataUpdateCoordinator):
             try:
                 # Get the mode name for key to check stored time values
                 mode_key = ""
-                if hasattr(unit, 'get_mode_name_for_key'):
+                if self._has_mode_key_method:
                     mode_key = unit.get_mode_name_for_key(mode)
                 else:
                     # Fallback implementation
-                    from systemair_api.utils.constants import UserModes as UM
-                    mode_map = {
-                        UM.HOLIDAY: "holiday",
-                        UM.AWAY: "away",
-                        UM.FIREPLACE: "fireplace", 
-                        UM.REFRESH: "refresh",
-                        UM.CROWDED: "crowded"
-                    }
-                    mode_key = mode_map.get(mode, "")
-                    _LOGGER.warning(f"VentilationUnit missing get_mode_name_for_key method, using fallback for mode {mode}")
+                    mode_key = _MODE_KEY.get(mode, "")
+                    _LOGGER.warning("VentilationUnit missing get_mode_name_for_key method, using fallback for mode %s", mode)
                 
-                _LOGGER.debug(f"Mode key for mode {mode}: {mode_key}")
+                _LOGGER.debug("Mode key for mode %s: %s", mode, mode_key)
                 
                 # If time_minutes wasn't provided, check if we have a stored value for this mode
-                if time_minutes is None and hasattr(unit, "user_mode_times") and mode_key:
+                if time_minutes is None and self._has_mode_times_attr and mode_key:
                     stored_time = unit.user_mode_times.get(mode_key)
                     if stored_time is not None:
                         time_minutes = stored_time
-                        _LOGGER.debug(f"Using stored time value of {time_minutes} minutes for mode {mode_key}")
+                        _LOGGER.debug("Using stored time value of %s minutes for mode %s", time_minutes, mode_key)
                 
                 # If still no time_minutes, fall back to configuration defaults
                 if time_minutes is None:
-                    from systemair_api.utils.constants import UserModes as UM2
-                    from .const import (
-                        CONF_DURATION_HOLIDAY,
-                        CONF_DURATION_AWAY,
-                        CONF_DURATION_FIREPLACE,
-                        CONF_DURATION_REFRESH,
-                        CONF_DURATION_CROWDED,
-                        convert_duration_to_minutes,
-                    )
-                    
-                    # Find the config entry for this device
-                    config_entry = None
-                    for entry_id, coordinator in self.hass.data[DOMAIN].items():
-                        if unit_id in coordinator.units:
-                            config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                            break
+                    # The config entry of this coordinator holds the duration defaults
+                    config_entry = self.config_entry
                     
                     if config_entry:
-                        # Map mode value to config key for durations
-                        mode_to_duration_config = {
-                            UM2.HOLIDAY: CONF_DURATION_HOLIDAY,
-                            UM2.AWAY: CONF_DURATION_AWAY,
-                            UM2.FIREPLACE: CONF_DURATION_FIREPLACE,
-                            UM2.REFRESH: CONF_DURATION_REFRESH,
-                            UM2.CROWDED: CONF_DURATION_CROWDED,
-                        }
-                        
                         # If the mode is a timed mode, get the default duration from config
-                        duration_config_key = mode_to_duration_config.get(mode)
+                        duration_config_key = MODE_TO_DURATION_KEY.get(mode)
                         if duration_config_key and duration_config_key in config_entry.data:
                             config_value = config_entry.data.get(duration_config_key)
                             time_minutes = convert_duration_to_minutes(duration_config_key, config_value)
-                            _LOGGER.debug(f"Using config default duration for {mode_key} mode: {time_minutes} minutes (from {config_value} {duration_config_key.split('_')[-1]})")
+                            _LOGGER.debug("Using config default duration for %s mode: %s minutes (from %s %s)", mode_key, time_minutes, config_value, DURATION_UNITS[duration_config_key])
                 
                 result = False
                 # Check if the unit supports the new set_user_mode method with time parameter
-                try:
-                    # Try to call with time parameter
-                    result = unit.set_user_mode(self.api, mode, time_minutes)
+                if self._set_user_mode_takes_time:
+                    # Call with time parameter
+                    await self._bucket.acquire()
+                    result = await self._run(
+                        unit.set_user_mode, self.api, mode, time_minutes
+                    )
                     if result:
                         # Update local state for optimistic updates
                         unit.user_mode = mode
+                        self._unconfirmed_units.add(unit_id)
                         # If we used a time value, record it for future reference
-                        if hasattr(unit, "user_mode_times") and time_minutes is not None and mode_key:
+                        if self._has_mode_times_attr and time_minutes is not None and mode_key:
                             unit.user_mode_times[mode_key] = time_minutes
-                            _LOGGER.debug(f"Mode {mode_key} activated with duration of {time_minutes} minutes")
+                            self._dirty_units.add(unit_id)
+                            _LOGGER.debug("Mode %s activated with duration of %s minutes", mode_key, time_minutes)
                             # Save the time value to persistent storage
-                            self.hass.async_create_task(self.async_save_stored_time_values())
-                except TypeError:
-                    # Fall back to old method if TypeError occurs (wrong number of arguments)
-                    result = unit.set_user_mode(self.api, mode)
+                            self._async_schedule_save_time_values()
+                else:
+                    # Fall back to old method without the time parameter
+                    await self._bucket.acquire()
+                    result = await self._run(
+                        unit.set_user_mode, self.api, mode
+                    )
                     if result:
                         # Update local state for optimistic updates
                         unit.user_mode = mode
+                        self._unconfirmed_units.add(unit_id)
                     _LOGGER.warning("This version of SystemAIR-API doesn't support setting mode time together with mode. Update the package for full functionality.")
                 return result
             except Exception as err:
-                _LOGGER.error(f"Failed to set mode with time: {err}")
+                _LOGGER.error("Failed to set mode with time: %s", err)
         return False
     
-    def set_fan_speed(self, unit_id: str, speed: int) -> bool:
+    async def async_set_fan_speed(self, unit_id: str, speed: int, skip_unchanged: bool = True) -> bool:
         """Set the fan speed, independent of user mode.
         
         Args:
             unit_id: The ID of the ventilation unit
             speed: The desired fan speed (1-5)
+            skip_unchanged: Skip the write when the unit already runs Manual at this level
             
         Returns:
             bool: True if successful, False otherwise
         """
-        from systemair_api.utils.register_constants import RegisterConstants
-        
-        _LOGGER.debug(f"Setting fan speed for unit {unit_id} to {speed}")
         unit = self.units.get(unit_id)
         if unit and self.api:
             try:
@@ -494,17 +741,28 @@ class SystemairUpdateCoordinator(DataUpdateCoordinator):
                 
                 # Validate input is between 1-5
                 airflow_value = max(1, min(5, speed))
-                _LOGGER.debug(f"Using direct airflow enum value: {airflow_value}")
-                _LOGGER.debug(f"Setting airflow level to {airflow_value}")
                 
                 # Set the airflow level using the correct register
-                register = RegisterConstants.REG_MAINBOARD_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF
-                _LOGGER.debug(f"Using register {register} (REG_MAINBOARD_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF)")
+                register = _REG_AIRFLOW
+                _LOGGER.debug(
+                    "Setting fan speed for unit %s to %s (requested %s) using register %s, current mode %s",
+                    unit_id, airflow_value, speed, register, unit.user_mode,
+                )
                 
-                # Check current mode
-                _LOGGER.debug(f"Current user mode before setting airflow: {unit.user_mode}")
+                # In manual mode the reported airflow is the manual level, skip writing the same value,
+                # but only when the device itself reported both the mode and the level
+                if (
+                    skip_unchanged
+                    and unit_id not in self._unconfirmed_units
+                    and unit.user_mode == UserModes.MANUAL
+                    and unit.airflow == airflow_value
+                ):
+                    _LOGGER.debug("Unit %s airflow already at level %s", unit_id, airflow_value)
+                    return True
                 
-                result = unit.set_value(
+                await self._bucket.acquire()
+                result = await self._run(
+                    unit.set_value,
                     self.api, 
                     register, 
                     airflow_value,
@@ -512,20 +770,41 @@ class SystemairUpdateCoordinator(DataUpdateCoordinator):
                 )
                 
                 if result:
-                    _LOGGER.debug(f"Successfully set airflow level for {unit_id} to {airflow_value}")
+                    _LOGGER.debug("Successfully set airflow level for %s to %s", unit_id, airflow_value)
                     # Manually update the airflow value in the unit instance for immediate feedback
                     unit.airflow = airflow_value
-                    _LOGGER.debug(f"Updated unit.airflow to level {unit.airflow}")
+                    self._unconfirmed_units.add(unit_id)
                     return True
                 else:
-                    _LOGGER.warning(f"Failed to set fan speed for {unit_id}")
+                    _LOGGER.warning("Failed to set fan speed for %s", unit_id)
                     
             except Exception as err:
-                _LOGGER.error(f"Failed to set fan speed: {err}")
+                _LOGGER.error("Failed to set fan speed: %s", err)
                 
         return False
     
-    def set_temperature(self, unit_id: str, temperature: float) -> bool:
+    async def async_set_manual_airflow(self, unit_id: str, level: int) -> bool:
+        """Switch the unit to Manual mode if needed and set its airflow level.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        unit = self.units.get(unit_id)
+        if unit is None:
+            return False
+        
+        # Check the mode just before writing, another call may have switched it already
+        was_manual = unit.user_mode == UserModes.MANUAL
+        if not was_manual:
+            if not await self.async_set_mode(unit_id, UserModes.MANUAL):
+                _LOGGER.error("Failed to set mode to Manual before setting airflow level")
+                return False
+        
+        # Right after switching to Manual the airflow is still the previous mode's,
+        # so only skip the write when the unit was already in Manual
+        return await self.async_set_fan_speed(unit_id, level, skip_unchanged=was_manual)
+    
+    async def async_set_temperature(self, unit_id: str, temperature: float) -> bool:
         """Set the temperature setpoint.
         
         Returns:
@@ -536,14 +815,17 @@ class SystemairUpdateCoordinator(DataUpdateCoordinator):
             try:
                 # Convert temperature to tenths of degrees as expected by the API
                 temp_tenths = int(temperature * 10)
-                result = unit.set_temperature(self.api, temp_tenths)
+                await self._bucket.acquire()
+                result = await self._run(
+                    unit.set_temperature, self.api, temp_tenths
+                )
                 
                 if result:
                     # Update local state for optimistic updates
                     unit.temperatures["setpoint"] = temperature
                 return result
             except Exception as err:
-                _LOGGER.error(f"Failed to set temperature: {err}")
+                _LOGGER.error("Failed to set temperature: %s", err)
         return False
                 
     async def async_load_stored_time_values(self) -> None:
@@ -551,29 +833,37 @@ class SystemairUpdateCoordinator(DataUpdateCoordinator):
         stored_data = await self.storage.async_load()
         if stored_data:
             self._stored_time_values = stored_data
-            _LOGGER.debug(f"Loaded stored time values: {self._stored_time_values}")
+            _LOGGER.debug("Loaded stored time values: %s", self._stored_time_values)
             
             # Apply stored values to units if they exist
             for unit_id, mode_times in self._stored_time_values.items():
-                if unit_id in self.units and hasattr(self.units[unit_id], "user_mode_times"):
+                if unit_id in self.units and self._has_mode_times_attr:
                     for mode, time_value in mode_times.items():
                         self.units[unit_id].user_mode_times[mode] = time_value
-                    _LOGGER.debug(f"Applied stored time values to unit {unit_id}")
+                    _LOGGER.debug("Applied stored time values to unit %s", unit_id)
+    
+    def _time_values_to_save(self) -> Dict[str, Dict[str, int]]:
+        """Merge the changed units' time values into the last stored values."""
+        for unit_id in self._dirty_units:
+            self._stored_time_values[unit_id] = dict(self.units[unit_id].user_mode_times)
+        self._dirty_units.clear()
+        _LOGGER.debug("Saving time values to storage: %s", self._stored_time_values)
+        return self._stored_time_values
     
     async def async_save_stored_time_values(self) -> None:
-        """Save time values to disk."""
-        # Build the data to save from the units' current values
-        data_to_save = {}
-        for unit_id, unit in self.units.items():
-            if hasattr(unit, "user_mode_times"):
-                data_to_save[unit_id] = dict(unit.user_mode_times)
-        
-        # Save to disk
-        await self.storage.async_save(data_to_save)
-        self._stored_time_values = data_to_save
-        _LOGGER.debug(f"Saved time values to storage: {data_to_save}")
+        """Save time values to disk, unless nothing changed since the last save."""
+        if not self._dirty_units:
+            _LOGGER.debug("Time values unchanged since last save, skipping write")
+            return
+        await self.storage.async_save(self._time_values_to_save())
+    
+    @callback
+    def _async_schedule_save_time_values(self) -> None:
+        """Schedule a delayed save so bursts of changes result in a single write."""
+        self.storage.async_delay_save(self._time_values_to_save, STORAGE_SAVE_DELAY)
     
-    def set_user_mode_time(self, unit_id: str, mode: str, time_value: int) -> bool:
+    @callback
+    def async_set_user_mode_time(self, unit_id: str, mode: str, time_value: int) -> bool:
         """Store the time duration for a specific user mode locally without sending to device.
         
         The time values are only stored locally and used when activating modes later.
@@ -591,16 +881,17 @@ class SystemairUpdateCoordinator(DataUpdateCoordinator):
         if unit:
             try:
                 # Store locally without sending to the API
-                if hasattr(unit, "user_mode_times"):
+                if self._has_mode_times_attr:
                     # Update local state only
                     unit.user_mode_times[mode] = time_value
-                    _LOGGER.debug(f"Stored {mode} mode time locally as {time_value} minutes for unit {unit_id}")
+                    self._dirty_units.add(unit_id)
+                    _LOGGER.debug("Stored %s mode time locally as %s minutes for unit %s", mode, time_value, unit_id)
                     
-                    # Schedule saving to persistent storage
-                    self.hass.async_create_task(self.async_save_stored_time_values())
+                    # Schedule saving to persistent storage, bursts of changes are written once
+                    self._async_schedule_save_time_values()
                     return True
                 else:
-                    _LOGGER.warning(f"Unit {unit_id} doesn't have user_mode_times attribute, can't store time value")
+                    _LOGGER.warning("Unit %s doesn't have user_mode_times attribute, can't store time value", unit_id)
             except Exception as err:
-                _LOGGER.error(f"Failed to store user mode time locally: {err}")
+                _LOGGER.error("Failed to store user mode time locally: %s", err)
         return False
\ No newline at end of file
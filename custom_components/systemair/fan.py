@@ -1,17 +1,16 @@
 """Fan platform for SystemAIR integration."""
 from __future__ import annotations
 
+import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util.percentage import (
-    ordered_list_item_to_percentage,
-    percentage_to_ordered_list_item,
-)
+from homeassistant.util.percentage import ordered_list_item_to_percentage
 
 from systemair_api.utils.constants import UserModes
 from .const import (
@@ -25,10 +24,32 @@ from .const import (
     FAN_SPEED_TO_VALUE,
     MODE_AUTO,
     MODE_MANUAL,
+    MODE_TO_DURATION_KEY,
+    DURATION_UNITS,
+    convert_duration_to_minutes,
 )
 from .coordinator import SystemairUpdateCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
 ORDERED_SPEEDS = [FAN_SPEED_1, FAN_SPEED_2, FAN_SPEED_3, FAN_SPEED_4, FAN_SPEED_5]
+# Percentage of each speed, and the speed value of each percentage range by its upper bound
+_LEVEL_TO_PERCENT = tuple(ordered_list_item_to_percentage(ORDERED_SPEEDS, speed) for speed in ORDERED_SPEEDS)
+_PERCENT_BUCKETS = tuple(
+    (percent, FAN_SPEED_TO_VALUE[speed]) for percent, speed in zip(_LEVEL_TO_PERCENT, ORDERED_SPEEDS)
+)
+
+# Map user mode values to preset mode names and back
+_USERMODE_TO_PRESET = MappingProxyType({
+    UserModes.AUTO: "auto",
+    UserModes.MANUAL: "manual",
+    UserModes.CROWDED: "crowded",
+    UserModes.REFRESH: "refresh",
+    UserModes.FIREPLACE: "fireplace",
+    UserModes.AWAY: "away",
+    UserModes.HOLIDAY: "holiday",
+})
+_PRESET_TO_USERMODE = MappingProxyType({v: k for k, v in _USERMODE_TO_PRESET.items()})
 
 
 async def async_setup_entry(
@@ -43,14 +64,15 @@ async def async_setup_entry(
     for unit_id, unit in coordinator.units.items():
         entities.append(SystemairFan(coordinator, unit_id))
 
-    async_add_entities(entities)
+    # The entities start with the state of the first refresh
+    async_add_entities(entities, update_before_add=False)
 
 
 class SystemairFan(CoordinatorEntity, FanEntity):
     """Representation of a SystemAIR fan entity."""
 
     _attr_supported_features = FanEntityFeature.SET_SPEED | FanEntityFeature.PRESET_MODE
-    _attr_preset_modes = ["auto", "manual", "crowded", "refresh", "fireplace", "away", "holiday"]
+    _attr_preset_modes = tuple(_PRESET_TO_USERMODE)
     _attr_speed_count = len(ORDERED_SPEEDS)
 
     def __init__(self, coordinator: SystemairUpdateCoordinator, unit_id: str) -> None:
@@ -60,124 +82,77 @@ class SystemairFan(CoordinatorEntity, FanEntity):
         self._unit = coordinator.units[unit_id]
         self._attr_unique_id = f"{unit_id}_fan"
         self._attr_name = f"{self._unit.name} Fan"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if fan is on."""
-        # Fan is on unless it's in mode 5 (away) or 6 (holiday)
-        return self._unit.user_mode < 5
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
+        self._update_attrs()
 
-    @property
-    def percentage(self) -> int | None:
-        """Return the fan percentage speed."""
+    def _update_attrs(self) -> None:
+        """Compute the fan state from the unit data."""
+        user_mode = self._unit.user_mode
+        # Fan is on unless it's in mode 5 (away) or 6 (holiday)
+        self._attr_is_on = user_mode is not None and user_mode < 5
+        
+        # Map user mode values to preset mode names
+        self._attr_preset_mode = _USERMODE_TO_PRESET.get(user_mode) if user_mode is not None else None
+        
         # Return percentage based on airflow level regardless of mode
         if self._unit.airflow is not None:
             # Convert airflow to a 1-5 scale
             airflow_level = max(1, min(5, self._unit.airflow // 20))
-            return ordered_list_item_to_percentage(
-                ORDERED_SPEEDS, 
-                ORDERED_SPEEDS[airflow_level - 1]
-            )
-        return None
-
-    @property
-    def preset_mode(self) -> str | None:
-        """Return the fan preset mode."""
-        if self._unit.user_mode is not None:
-            # Map user mode values to preset mode names
-            mode_mapping = {
-                UserModes.AUTO: "auto",
-                UserModes.MANUAL: "manual",
-                UserModes.CROWDED: "crowded",
-                UserModes.REFRESH: "refresh",
-                UserModes.FIREPLACE: "fireplace",
-                UserModes.AWAY: "away",
-                UserModes.HOLIDAY: "holiday",
-            }
-            return mode_mapping.get(self._unit.user_mode)
-        return None
+            self._attr_percentage = _LEVEL_TO_PERCENT[airflow_level - 1]
+        else:
+            self._attr_percentage = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._unit_id not in self.coordinator.changed_units:
+            return
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the fan speed percentage."""
         # Set the speed based on percentage, independent of mode
-        speed_name = percentage_to_ordered_list_item(ORDERED_SPEEDS, percentage)
-        speed_value = FAN_SPEED_TO_VALUE.get(speed_name, 3)  # Default to 3 if not found
-        
-        await self.hass.async_add_executor_job(
-            self.coordinator.set_fan_speed, self._unit_id, speed_value
+        speed_value = next(
+            (value for upper, value in _PERCENT_BUCKETS if percentage <= upper),
+            _PERCENT_BUCKETS[-1][1],  # Above the last bound, use the highest speed
         )
-        await self.coordinator.async_request_refresh()
+        
+        if await self.coordinator.async_set_fan_speed(self._unit_id, speed_value):
+            self._async_optimistic_update()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the fan preset mode."""
         # Map preset modes to UserModes
-        mode_mapping = {
-            "auto": UserModes.AUTO,
-            "manual": UserModes.MANUAL,
-            "crowded": UserModes.CROWDED,
-            "refresh": UserModes.REFRESH,
-            "fireplace": UserModes.FIREPLACE,
-            "away": UserModes.AWAY,
-            "holiday": UserModes.HOLIDAY,
-        }
-        
-        if preset_mode in mode_mapping:
-            mode_value = mode_mapping[preset_mode]
-            
-            # Get default time duration for timed modes
-            time_minutes = None
-            config_entry = None
+        if preset_mode in _PRESET_TO_USERMODE:
+            mode_value = _PRESET_TO_USERMODE[preset_mode]
             
-            # Find the config entry for this device
-            for entry_id, coordinator in self.hass.data[DOMAIN].items():
-                if self._unit_id in coordinator.units:
-                    config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                    break
-                    
-            # Map mode value to config key for durations
-            if config_entry:
-                from .const import (
-                    CONF_DURATION_HOLIDAY,
-                    CONF_DURATION_AWAY,
-                    CONF_DURATION_FIREPLACE,
-                    CONF_DURATION_REFRESH,
-                    CONF_DURATION_CROWDED,
-                    convert_duration_to_minutes,
-                )
-                
-                mode_to_duration_config = {
-                    UserModes.HOLIDAY: CONF_DURATION_HOLIDAY,
-                    UserModes.AWAY: CONF_DURATION_AWAY,
-                    UserModes.FIREPLACE: CONF_DURATION_FIREPLACE,
-                    UserModes.REFRESH: CONF_DURATION_REFRESH,
-                    UserModes.CROWDED: CONF_DURATION_CROWDED,
-                }
-                
-                # If the mode is a timed mode, get the default duration from config
-                duration_config_key = mode_to_duration_config.get(mode_value)
-                if duration_config_key and duration_config_key in config_entry.data:
-                    config_value = config_entry.data.get(duration_config_key)
-                    time_minutes = convert_duration_to_minutes(duration_config_key, config_value)
-                    self.coordinator._LOGGER.debug(f"Using default duration for {preset_mode} mode: {time_minutes} minutes (from {config_value} {duration_config_key.split('_')[-1]})")
+            # Get default time duration for timed modes from config
+            config_data = self.coordinator.config_entry.data
+            duration_config_key = MODE_TO_DURATION_KEY.get(mode_value)
+            time_minutes = (
+                convert_duration_to_minutes(duration_config_key, config_data[duration_config_key])
+                if duration_config_key in config_data
+                else None
+            )
+            if time_minutes is not None:
+                _LOGGER.debug("Using default duration for %s mode: %s minutes (from %s %s)", preset_mode, time_minutes, config_data[duration_config_key], DURATION_UNITS[duration_config_key])
                     
-            # Use set_mode_with_time if we have a time value, otherwise use set_mode
+            # Use async_set_mode_with_time if we have a time value, otherwise use async_set_mode
             if time_minutes is not None:
-                await self.hass.async_add_executor_job(
-                    self.coordinator.set_mode_with_time, self._unit_id, mode_value, time_minutes
-                )
+                result = await self.coordinator.async_set_mode_with_time(self._unit_id, mode_value, time_minutes)
             else:
-                await self.hass.async_add_executor_job(
-                    self.coordinator.set_mode, self._unit_id, mode_value
-                )
+                result = await self.coordinator.async_set_mode(self._unit_id, mode_value)
                 
-            await self.coordinator.async_request_refresh()
+            if result:
+                self._async_optimistic_update()
+
+    @callback
+    def _async_optimistic_update(self) -> None:
+        """Show the state the coordinator stored for a successful write."""
+        self.coordinator.async_notify_unit_changed(self._unit_id)
+        # Confirm it with a single poll once the user stops changing it
+        self.coordinator.reconcile_debouncer.async_schedule_call()
 
     async def async_turn_on(
         self, percentage: int | None = None, preset_mode: str | None = None, **kwargs: Any
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Callable
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
@@ -13,11 +14,42 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from systemair_api.models.ventilation_unit import VentilationUnit
 
-from .const import DOMAIN, MODE_MANUAL, FAN_SPEED_TO_VALUE
+from .const import (
+    DOMAIN,
+    MODE_MANUAL,
+    FAN_SPEED_TO_VALUE,
+    CONF_DURATION_HOLIDAY,
+    CONF_DURATION_AWAY,
+    CONF_DURATION_FIREPLACE,
+    CONF_DURATION_REFRESH,
+    CONF_DURATION_CROWDED,
+    DEFAULT_DURATION_HOLIDAY,
+    DEFAULT_DURATION_AWAY,
+    DEFAULT_DURATION_FIREPLACE,
+    DEFAULT_DURATION_REFRESH,
+    DEFAULT_DURATION_CROWDED,
+    DURATION_UNITS,
+)
 from .coordinator import SystemairUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map mode keys to config keys
+_MODE_TO_CONFIG_KEY = MappingProxyType({
+    'holiday': CONF_DURATION_HOLIDAY,
+    'away': CONF_DURATION_AWAY,
+    'fireplace': CONF_DURATION_FIREPLACE,
+    'refresh': CONF_DURATION_REFRESH,
+    'crowded': CONF_DURATION_CROWDED,
+})
+_MODE_TO_DEFAULT = MappingProxyType({
+    'holiday': DEFAULT_DURATION_HOLIDAY,
+    'away': DEFAULT_DURATION_AWAY,
+    'fireplace': DEFAULT_DURATION_FIREPLACE,
+    'refresh': DEFAULT_DURATION_REFRESH,
+    'crowded': DEFAULT_DURATION_CROWDED,
+})
+
 # Define entity descriptions for mode times - these are config values, not device values
 MODE_TIME_DESCRIPTIONS = [
     NumberEntityDescription(
@@ -87,7 +119,8 @@ async def async_setup_entry(
         
         # Airflow level entity is now a select entity, not a number entity
             
-    async_add_entities(entities)
+    # The entities start with the configured values
+    async_add_entities(entities, update_before_add=False)
 
 
 class SystemairModeTimeEntity(CoordinatorEntity, NumberEntity):
@@ -105,12 +138,9 @@ class SystemairModeTimeEntity(CoordinatorEntity, NumberEntity):
         self.entity_description = description
         self._unit: VentilationUnit = coordinator.units[unit_id]
         self._attr_unique_id = f"{unit_id}_{description.key}_mode_time"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Ventilation Unit",
-        }
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
+        # Only changes when the configuration entry does
+        self._attr_native_value = self._value_from_entry(coordinator.config_entry)
     
     @property
     def name(self) -> str:
@@ -122,102 +152,38 @@ class SystemairModeTimeEntity(CoordinatorEntity, NumberEntity):
         """Return if the entity is available."""
         return self.coordinator.available and self.unit_id in self.coordinator.units
     
-    @property
-    def native_value(self) -> int:
-        """Return the current configuration value."""
+    async def async_added_to_hass(self) -> None:
+        """Follow changes of the configuration entry."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.config_entry.add_update_listener(self._async_entry_updated)
+        )
+    
+    async def _async_entry_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Update the value after the configuration entry changed."""
+        self._attr_native_value = self._value_from_entry(entry)
+        self.async_write_ha_state()
+    
+    def _value_from_entry(self, config_entry: ConfigEntry) -> int:
+        """Return the configured value of this mode time."""
         mode_key = self.entity_description.key
         
         # Get values from configuration entry, not from device
-        config_entry = None
-        for entry_id, coordinator in self.hass.data[DOMAIN].items():
-            if self.unit_id in coordinator.units:
-                config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                break
-        
-        if config_entry:
-            from .const import (
-                CONF_DURATION_HOLIDAY,
-                CONF_DURATION_AWAY, 
-                CONF_DURATION_FIREPLACE,
-                CONF_DURATION_REFRESH,
-                CONF_DURATION_CROWDED,
-            )
-            
-            # Map mode keys to config keys
-            mode_to_config = {
-                'holiday': CONF_DURATION_HOLIDAY,
-                'away': CONF_DURATION_AWAY,
-                'fireplace': CONF_DURATION_FIREPLACE,
-                'refresh': CONF_DURATION_REFRESH,
-                'crowded': CONF_DURATION_CROWDED,
-            }
-            
-            config_key = mode_to_config.get(mode_key)
-            if config_key and config_key in config_entry.data:
-                return int(config_entry.data[config_key])
+        config_key = _MODE_TO_CONFIG_KEY.get(mode_key)
+        if config_key and config_key in config_entry.data:
+            return int(config_entry.data[config_key])
         
         # Fallback to defaults
-        from .const import (
-            DEFAULT_DURATION_HOLIDAY,
-            DEFAULT_DURATION_AWAY,
-            DEFAULT_DURATION_FIREPLACE, 
-            DEFAULT_DURATION_REFRESH,
-            DEFAULT_DURATION_CROWDED,
-        )
-        
-        defaults = {
-            'holiday': DEFAULT_DURATION_HOLIDAY,
-            'away': DEFAULT_DURATION_AWAY,
-            'fireplace': DEFAULT_DURATION_FIREPLACE,
-            'refresh': DEFAULT_DURATION_REFRESH,
-            'crowded': DEFAULT_DURATION_CROWDED,
-        }
-        
-        return int(defaults.get(mode_key, 0))
+        return int(_MODE_TO_DEFAULT.get(mode_key, 0))
             
-    def get_mode_name_for_key(self, mode_value: int) -> str:
-        """Map numeric mode value to string mode key."""
-        from systemair_api.utils.constants import UserModes
-        mode_map = {
-            UserModes.HOLIDAY: "holiday",
-            UserModes.AWAY: "away",
-            UserModes.FIREPLACE: "fireplace",
-            UserModes.REFRESH: "refresh",
-            UserModes.CROWDED: "crowded"
-        }
-        return mode_map.get(mode_value, "")
-    
     async def async_set_native_value(self, value: float) -> None:
         """Update the configuration value."""
         mode_key = self.entity_description.key
         new_value = int(value)
         
-        # Find the config entry for this device
-        config_entry = None
-        for entry_id, coordinator in self.hass.data[DOMAIN].items():
-            if self.unit_id in coordinator.units:
-                config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                break
-        
+        config_entry = self.coordinator.config_entry
         if config_entry:
-            from .const import (
-                CONF_DURATION_HOLIDAY,
-                CONF_DURATION_AWAY,
-                CONF_DURATION_FIREPLACE,
-                CONF_DURATION_REFRESH,
-                CONF_DURATION_CROWDED,
-            )
-            
-            # Map mode keys to config keys
-            mode_to_config = {
-                'holiday': CONF_DURATION_HOLIDAY,
-                'away': CONF_DURATION_AWAY,
-                'fireplace': CONF_DURATION_FIREPLACE,
-                'refresh': CONF_DURATION_REFRESH,
-                'crowded': CONF_DURATION_CROWDED,
-            }
-            
-            config_key = mode_to_config.get(mode_key)
+            config_key = _MODE_TO_CONFIG_KEY.get(mode_key)
             if config_key:
                 # Validate the value based on the mode
                 valid = True
@@ -230,24 +196,22 @@ class SystemairModeTimeEntity(CoordinatorEntity, NumberEntity):
                 
                 if valid:
                     # Update the config entry data
-                    new_data = dict(config_entry.data)
-                    new_data[config_key] = new_value
-                    
-                    self.hass.config_entries.async_update_entry(
-                        config_entry, data=new_data
-                    )
+                    if config_entry.data.get(config_key) != new_value:
+                        self.hass.config_entries.async_update_entry(
+                            config_entry, data={**config_entry.data, config_key: new_value}
+                        )
                     
                     # Update the UI
+                    self._attr_native_value = new_value
                     self.async_write_ha_state()
                     
-                    unit_name = "days" if mode_key == 'holiday' else ("hours" if mode_key in ['away', 'crowded'] else "minutes")
-                    _LOGGER.debug(f"Updated {mode_key} mode duration to {new_value} {unit_name}")
+                    _LOGGER.debug("Updated %s mode duration to %s %s", mode_key, new_value, DURATION_UNITS[config_key])
                 else:
-                    _LOGGER.error(f"Invalid value {new_value} for {mode_key} mode duration")
+                    _LOGGER.error("Invalid value %s for %s mode duration", new_value, mode_key)
             else:
-                _LOGGER.error(f"Unknown mode key: {mode_key}")
+                _LOGGER.error("Unknown mode key: %s", mode_key)
         else:
-            _LOGGER.error(f"Could not find config entry for unit {self.unit_id}")
+            _LOGGER.error("Could not find config entry for unit %s", self.unit_id)
 
 
 # The airflow level entity is now a select entity instead of a number entity
\ No newline at end of file
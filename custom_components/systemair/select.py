@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Final
+from types import MappingProxyType
+from typing import Any, Final, Mapping
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -23,13 +24,17 @@ from .const import (
     AIRFLOW_NORMAL,
     AIRFLOW_HIGH,
     AIRFLOW_LEVEL_TO_VALUE,
+    CONF_DURATION_REFRESH,
+    DEFAULT_BASE_OPERATION_MODE,
+    DEFAULT_BASE_AIRFLOW_LEVEL,
+    convert_duration_to_minutes,
 )
 from .coordinator import SystemairUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 # Define a mapping of mode values to friendly names
-MODE_OPTIONS: Dict[int, str] = {
+MODE_OPTIONS: Mapping[int, str] = MappingProxyType({
     UserModes.AUTO: "Auto",
     UserModes.MANUAL: "Manual",
     UserModes.CROWDED: "Crowded",
@@ -37,28 +42,29 @@ MODE_OPTIONS: Dict[int, str] = {
     UserModes.FIREPLACE: "Fireplace",
     UserModes.AWAY: "Away", 
     UserModes.HOLIDAY: "Holiday",
-}
+})
 
 # Airflow level options for the select entity
 AIRFLOW_LEVEL_OPTIONS = ["Off", "Low", "Normal", "High", "Refresh"]
 
 # Options that can be selected by the user (excludes Off and Refresh)
 AIRFLOW_SELECTABLE_OPTIONS = ["Low", "Normal", "High", "Refresh"]
+_AIRFLOW_SELECTABLE = frozenset(AIRFLOW_SELECTABLE_OPTIONS)
 
 # Mapping from level name to value (1-5)
-AIRFLOW_NAME_TO_LEVEL = {
+AIRFLOW_NAME_TO_LEVEL = MappingProxyType({
     "Off": 1,
     "Low": 2, 
     "Normal": 3,
     "High": 4,
     "Refresh": 5
-}
+})
 
 # Mapping from level value to name
-AIRFLOW_LEVEL_TO_NAME = {v: k for k, v in AIRFLOW_NAME_TO_LEVEL.items()}
+AIRFLOW_LEVEL_TO_NAME = MappingProxyType({v: k for k, v in AIRFLOW_NAME_TO_LEVEL.items()})
 
 # Reverse mapping for lookup
-MODE_NAME_TO_MODE_VALUE = {v: k for k, v in MODE_OPTIONS.items()}
+MODE_NAME_TO_MODE_VALUE = MappingProxyType({v: k for k, v in MODE_OPTIONS.items()})
 
 # Base operation mode options (configuration)
 BASE_OPERATION_MODE_OPTIONS = list(MODE_NAME_TO_VALUE.keys())
@@ -87,7 +93,8 @@ async def async_setup_entry(
         entities.append(SystemairBaseOperationModeSelect(coordinator, unit_id))
         entities.append(SystemairBaseAirflowLevelSelect(coordinator, unit_id))
 
-    async_add_entities(entities)
+    # The entities start with the state of the first refresh
+    async_add_entities(entities, update_before_add=False)
 
 
 class SystemairOperationModeSelect(CoordinatorEntity, SelectEntity):
@@ -96,7 +103,7 @@ class SystemairOperationModeSelect(CoordinatorEntity, SelectEntity):
     _attr_has_entity_name = True
     _attr_name = "Operation Mode"
     _attr_icon = "mdi:fan-speed-3"
-    _attr_options = list(MODE_OPTIONS.values())
+    _attr_options = tuple(MODE_OPTIONS.values())
 
     def __init__(self, coordinator: SystemairUpdateCoordinator, unit_id: str) -> None:
         """Initialize the operation mode select entity."""
@@ -104,39 +111,37 @@ class SystemairOperationModeSelect(CoordinatorEntity, SelectEntity):
         self._unit_id = unit_id
         self._unit = coordinator.units[unit_id]
         self._attr_unique_id = f"{unit_id}_operation_mode_select"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
+        self._update_current_option()
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected operation mode."""
-        if self._unit.user_mode is not None and self._unit.user_mode in MODE_OPTIONS:
-            return MODE_OPTIONS[self._unit.user_mode]
-        return None
+    def _update_current_option(self) -> None:
+        """Compute the current selected operation mode."""
+        self._attr_current_option = MODE_OPTIONS.get(self._unit.user_mode)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._unit_id not in self.coordinator.changed_units:
+            return
+        self._update_current_option()
+        super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         if option not in MODE_NAME_TO_MODE_VALUE:
-            _LOGGER.error(f"Unknown operation mode: {option}")
+            _LOGGER.error("Unknown operation mode: %s", option)
             return
 
         mode_value = MODE_NAME_TO_MODE_VALUE[option]
         
         # Set mode and get result
-        result = await self.hass.async_add_executor_job(
-            self.coordinator.set_mode, self._unit_id, mode_value
-        )
+        result = await self.coordinator.async_set_mode(self._unit_id, mode_value)
         
         # Skip immediate refresh - use optimistic update instead
         if result:
             # Use optimistic update
             self._unit.user_mode = mode_value
-            self.async_write_ha_state()
+            self.coordinator.async_notify_unit_changed(self._unit_id)
 
 
 class SystemairAirflowLevelSelect(CoordinatorEntity, SelectEntity):
@@ -145,7 +150,7 @@ class SystemairAirflowLevelSelect(CoordinatorEntity, SelectEntity):
     _attr_has_entity_name = True
     _attr_name = "Airflow Level"
     _attr_icon = "mdi:fan"
-    _attr_options = AIRFLOW_LEVEL_OPTIONS  # Keep full options list for display
+    _attr_options = tuple(AIRFLOW_LEVEL_OPTIONS)  # Keep full options list for display
     _attr_selectable = False  # Non-standard attribute for template use
 
     def __init__(self, coordinator: SystemairUpdateCoordinator, unit_id: str) -> None:
@@ -154,129 +159,90 @@ class SystemairAirflowLevelSelect(CoordinatorEntity, SelectEntity):
         self._unit_id = unit_id
         self._unit = coordinator.units[unit_id]
         self._attr_unique_id = f"{unit_id}_airflow_level_select"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
+        self._update_attrs()
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected airflow level."""
+    def _update_attrs(self) -> None:
+        """Compute the current selected airflow level and its attributes."""
         if self._unit.airflow is not None:
             # Make sure the airflow value is within valid range (1-5)
             level = max(1, min(5, self._unit.airflow))
-            _LOGGER.debug(f"Airflow level for {self._unit_id}: {level}")
-            return AIRFLOW_LEVEL_TO_NAME.get(level, "Normal")  # Default to Normal if not found
-        return None
+            _LOGGER.debug("Airflow level for %s: %s", self._unit_id, level)
+            current = AIRFLOW_LEVEL_TO_NAME.get(level, "Normal")  # Default to Normal if not found
+        else:
+            current = None
+        self._attr_current_option = current
         
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes about the airflow level."""
-        current = self.current_option
-        return {
+        # Additional attributes about the airflow level
+        self._attr_extra_state_attributes = {
             "selectable_options": AIRFLOW_SELECTABLE_OPTIONS,
-            "is_selectable": current in AIRFLOW_SELECTABLE_OPTIONS,
+            "is_selectable": current in _AIRFLOW_SELECTABLE,
             "level": AIRFLOW_NAME_TO_LEVEL.get(current, 3),
             "mode": self._unit.user_mode_name.lower() if self._unit.user_mode_name else "unknown"
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._unit_id not in self.coordinator.changed_units:
+            return
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         # Restrict selection to the allowed options
-        if option not in AIRFLOW_SELECTABLE_OPTIONS:
-            _LOGGER.error(f"Cannot select restricted airflow level: {option}")
+        if option not in _AIRFLOW_SELECTABLE:
+            _LOGGER.error("Cannot select restricted airflow level: %s", option)
             return
         
         if option not in AIRFLOW_NAME_TO_LEVEL:
-            _LOGGER.error(f"Unknown airflow level: {option}")
+            _LOGGER.error("Unknown airflow level: %s", option)
             return
 
         level = AIRFLOW_NAME_TO_LEVEL[option]
-        _LOGGER.debug(f"Setting airflow level to {level} ({option})")
+        _LOGGER.debug("Setting airflow level to %s (%s)", level, option)
         
         # Special handling for Refresh level
         if option == "Refresh":
             _LOGGER.debug("Special handling for Refresh mode")
             # Set the ventilation unit to Refresh mode
-            from systemair_api.utils.constants import UserModes
-            
             # Check for configured duration
-            config_entry = None
             time_minutes = None
+            config_entry = self.coordinator.config_entry
             
-            # Find the config entry for this device
-            for entry_id, coordinator in self.hass.data[DOMAIN].items():
-                if self._unit_id in coordinator.units:
-                    config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                    break
-                    
             # Get refresh duration from config
             if config_entry:
-                from .const import CONF_DURATION_REFRESH, convert_duration_to_minutes
                 if CONF_DURATION_REFRESH in config_entry.data:
                     config_value = config_entry.data.get(CONF_DURATION_REFRESH)
                     time_minutes = convert_duration_to_minutes(CONF_DURATION_REFRESH, config_value)
-                    _LOGGER.debug(f"Using configured Refresh duration: {time_minutes} minutes (from {config_value} minutes)")
+                    _LOGGER.debug("Using configured Refresh duration: %s minutes (from %s minutes)", time_minutes, config_value)
                     
             # Set refresh mode with time if available
             if time_minutes is not None:
-                result = await self.hass.async_add_executor_job(
-                    self.coordinator.set_mode_with_time,
-                    self._unit_id,
-                    UserModes.REFRESH,
-                    time_minutes
-                )
+                result = await self.coordinator.async_set_mode_with_time(self._unit_id, UserModes.REFRESH, time_minutes)
             else:
                 # No configured time, just set the mode
-                result = await self.hass.async_add_executor_job(
-                    self.coordinator.set_mode,
-                    self._unit_id,
-                    UserModes.REFRESH
-                )
+                result = await self.coordinator.async_set_mode(self._unit_id, UserModes.REFRESH)
                 
             # Optimistic update
             if result:
                 self._unit.user_mode = UserModes.REFRESH
                 self._unit.airflow = level  # Also update airflow level
-                self.async_write_ha_state()
+                self.coordinator.async_notify_unit_changed(self._unit_id)
                 
         else:
             # For Low, Medium, High - set to Manual mode first if needed
             # then set the airflow level
-            _LOGGER.debug(f"Setting to Manual mode with airflow level {level}")
-            from systemair_api.utils.constants import UserModes
-            
-            set_manual_first = False
-            # If not already in Manual mode, we need to switch to Manual first
-            if self._unit.user_mode != UserModes.MANUAL:
-                set_manual_first = True
-                
-            if set_manual_first:
-                # First set to Manual mode
-                mode_result = await self.hass.async_add_executor_job(
-                    self.coordinator.set_mode, self._unit_id, UserModes.MANUAL
-                )
-                
-                if not mode_result:
-                    _LOGGER.error(f"Failed to set mode to Manual before setting airflow level")
-                    return
-                
-                # Update unit mode for optimistic update
-                self._unit.user_mode = UserModes.MANUAL
-            
-            # Then set the airflow level
-            result = await self.hass.async_add_executor_job(
-                self.coordinator.set_fan_speed, self._unit_id, level
-            )
+            _LOGGER.debug("Setting to Manual mode with airflow level %s", level)
+            # Switch to Manual mode first if needed, then set the airflow level
+            result = await self.coordinator.async_set_manual_airflow(self._unit_id, level)
             
             # Skip immediate refresh - use optimistic update instead
             if result:
                 # Use optimistic update
                 self._unit.airflow = level
-                self.async_write_ha_state()
+                self.coordinator.async_notify_unit_changed(self._unit_id)
 
 
 class SystemairBaseOperationModeSelect(CoordinatorEntity, SelectEntity):
@@ -286,7 +252,7 @@ class SystemairBaseOperationModeSelect(CoordinatorEntity, SelectEntity):
     _attr_name = "Default Operation Mode"
     _attr_icon = "mdi:cog"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_options = BASE_OPERATION_MODE_OPTIONS
+    _attr_options = tuple(BASE_OPERATION_MODE_OPTIONS)
 
     def __init__(self, coordinator: SystemairUpdateCoordinator, unit_id: str) -> None:
         """Initialize the base operation mode select entity."""
@@ -294,43 +260,26 @@ class SystemairBaseOperationModeSelect(CoordinatorEntity, SelectEntity):
         self._unit_id = unit_id
         self._unit = coordinator.units[unit_id]
         self._attr_unique_id = f"{unit_id}_base_operation_mode_config"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
 
     @property
     def current_option(self) -> str | None:
         """Return the current base operation mode from config."""
-        # Get the config entry for this unit
-        config_entry = None
-        for entry_id, coordinator in self.hass.data[DOMAIN].items():
-            if self._unit_id in coordinator.units:
-                config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                break
+        config_entry = self.coordinator.config_entry
         
         if config_entry:
-            from .const import DEFAULT_BASE_OPERATION_MODE
             return config_entry.data.get(CONF_BASE_OPERATION_MODE, DEFAULT_BASE_OPERATION_MODE)
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Update the base operation mode configuration."""
-        # Find the config entry
-        config_entry = None
-        for entry_id, coordinator in self.hass.data[DOMAIN].items():
-            if self._unit_id in coordinator.units:
-                config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                break
+        config_entry = self.coordinator.config_entry
         
         if config_entry:
             # Update the config entry data
             new_data = {**config_entry.data, CONF_BASE_OPERATION_MODE: option}
             self.hass.config_entries.async_update_entry(config_entry, data=new_data)
-            _LOGGER.info(f"Updated base operation mode to: {option}")
+            _LOGGER.info("Updated base operation mode to: %s", option)
             self.async_write_ha_state()
 
 
@@ -341,7 +290,7 @@ class SystemairBaseAirflowLevelSelect(CoordinatorEntity, SelectEntity):
     _attr_name = "Default Airflow Level"
     _attr_icon = "mdi:fan-speed-1"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_options = BASE_AIRFLOW_LEVEL_OPTIONS
+    _attr_options = tuple(BASE_AIRFLOW_LEVEL_OPTIONS)
 
     def __init__(self, coordinator: SystemairUpdateCoordinator, unit_id: str) -> None:
         """Initialize the base airflow level select entity."""
@@ -349,41 +298,24 @@ class SystemairBaseAirflowLevelSelect(CoordinatorEntity, SelectEntity):
         self._unit_id = unit_id
         self._unit = coordinator.units[unit_id]
         self._attr_unique_id = f"{unit_id}_base_airflow_level_config"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
+        self._attr_device_info = coordinator.device_info_by_unit[unit_id]
 
     @property
     def current_option(self) -> str | None:
         """Return the current base airflow level from config."""
-        # Get the config entry for this unit
-        config_entry = None
-        for entry_id, coordinator in self.hass.data[DOMAIN].items():
-            if self._unit_id in coordinator.units:
-                config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                break
+        config_entry = self.coordinator.config_entry
         
         if config_entry:
-            from .const import DEFAULT_BASE_AIRFLOW_LEVEL
             return config_entry.data.get(CONF_BASE_AIRFLOW_LEVEL, DEFAULT_BASE_AIRFLOW_LEVEL)
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Update the base airflow level configuration."""
-        # Find the config entry
-        config_entry = None
-        for entry_id, coordinator in self.hass.data[DOMAIN].items():
-            if self._unit_id in coordinator.units:
-                config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                break
+        config_entry = self.coordinator.config_entry
         
         if config_entry:
             # Update the config entry data
             new_data = {**config_entry.data, CONF_BASE_AIRFLOW_LEVEL: option}
             self.hass.config_entries.async_update_entry(config_entry, data=new_data)
-            _LOGGER.info(f"Updated base airflow level to: {option}")
+            _LOGGER.info("Updated base airflow level to: %s", option)
             self.async_write_ha_state()
\ No newline at end of file
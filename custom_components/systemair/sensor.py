@@ -16,7 +16,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -27,13 +27,19 @@ from .const import DOMAIN
 from .coordinator import SystemairUpdateCoordinator
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class SystemairSensorEntityDescription(SensorEntityDescription):
     """Class describing SystemAIR sensor entities."""
 
     value_fn: Callable[[VentilationUnit], Any] = None
 
 
+def _remaining(unit: VentilationUnit) -> float | None:
+    """Return the remaining time of the user mode in minutes."""
+    remaining = getattr(unit, 'user_mode_remaining_time', None)
+    return round(remaining / 60, 1) if remaining is not None else None
+
+
 SENSOR_TYPES = [
     # Temperature sensors
     SystemairSensorEntityDescription(
@@ -97,12 +103,13 @@ SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfTime.MINUTES,
         icon="mdi:timer-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda unit: round(getattr(unit, 'user_mode_remaining_time', 0) / 60, 1) if getattr(unit, 'user_mode_remaining_time', None) is not None else None,
+        value_fn=_remaining,
     ),
     
     # Removed airflow percentage sensor as it doesn't exist
     
-    # Filter status - using active_alarms as a proxy for filter status
+    # Filter status - using active_alarms as a proxy for filter status,
+    # the filter_alarm binary sensor reports the same alarm as a problem
     SystemairSensorEntityDescription(
         key="filter_status",
         name="Filter status",
@@ -120,17 +127,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the SystemAIR sensor platform."""
     coordinator: SystemairUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-
-    for unit_id, unit in coordinator.units.items():
-        entities.extend(
-            [
-                SystemairSensor(coordinator, unit_id, description)
-                for description in SENSOR_TYPES
-            ]
-        )
 
-    async_add_entities(entities)
+    async_add_entities(
+        SystemairSensor(coordinator, unit_id, description, device_info)
+        for unit_id, device_info in coordinator.device_info_by_unit.items()
+        for description in SENSOR_TYPES
+    )
 
 
 class SystemairSensor(CoordinatorEntity, SensorEntity):
@@ -143,26 +145,35 @@ class SystemairSensor(CoordinatorEntity, SensorEntity):
         coordinator: SystemairUpdateCoordinator,
         unit_id: str,
         description: SystemairSensorEntityDescription,
+        device_info: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._unit_id = unit_id
-        self._unit = coordinator.units[unit_id]
-        self._attr_unique_id = f"{unit_id}_{description.key}"
-        self._attr_name = f"{self._unit.name} {description.name}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, unit_id)},
-            "name": self._unit.name,
-            "manufacturer": "Systemair",
-            "model": self._unit.model or "Systemair Ventilation Unit",
-            "sw_version": next((v.get("version") for v in self._unit.versions if v.get("type") == "SW"), None),
-        }
-
-    @property
-    def native_value(self) -> Any:
-        """Return the value of the sensor."""
-        if self.coordinator.data and self._unit_id in self.coordinator.data:
-            unit = self.coordinator.data[self._unit_id]
-            return self.entity_description.value_fn(unit)
-        return None
\ No newline at end of file
+        self._attr_unique_id = unit_id + "_" + description.key
+        self._attr_name = coordinator.unit_name_by_id[unit_id] + " " + description.name
+        self._attr_device_info = device_info
+        self._attr_native_value = self._compute_native_value()
+        self._last_available = coordinator.last_update_success
+
+    def _compute_native_value(self) -> Any:
+        """Compute the value of the sensor from the coordinator data."""
+        data = self.coordinator.data
+        unit = data.get(self._unit_id) if data else None
+        if unit is None:
+            return None
+        return self.entity_description.value_fn(unit)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, skipping unchanged states."""
+        if self._unit_id not in self.coordinator.changed_units:
+            return
+        value = self._compute_native_value()
+        available = self.available
+        if value == self._attr_native_value and available == self._last_available:
+            return
+        self._attr_native_value = value
+        self._last_available = available
+        super()._handle_coordinator_update()
\ No newline at end of file
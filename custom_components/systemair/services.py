@@ -2,18 +2,17 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
+
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 from homeassistant.helpers.device_registry import async_get as async_get_device_registry
 
 from systemair_api.utils.exceptions import SystemairError
 
-from systemair_api.utils.constants import UserModes
-
 from .const import (
     DOMAIN,
     SERVICE_SET_USER_MODE,
@@ -21,20 +20,32 @@ from .const import (
     SERVICE_SET_ROOM_TEMP_SETPOINT,
     SERVICE_SET_USER_MODE_TIME,
     MODE_NAME_TO_VALUE,
-    CONF_DURATION_HOLIDAY,
-    CONF_DURATION_AWAY,
-    CONF_DURATION_FIREPLACE,
-    CONF_DURATION_REFRESH,
-    CONF_DURATION_CROWDED,
+    MODE_TO_DURATION_KEY,
+    DURATION_UNITS,
     convert_duration_to_minutes,
 )
 from .coordinator import SystemairUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Modes whose duration can be stored with set_user_mode_time
+_TIMED_MODE_NAMES = frozenset(["holiday", "away", "fireplace", "refresh", "crowded"])
+
+
+def _get_coordinator_for_entity(hass: HomeAssistant, entity_id: str) -> SystemairUpdateCoordinator | None:
+    """Get the coordinator of the config entry that owns an entity."""
+    entity_entry = async_get_entity_registry(hass).async_get(entity_id)
+    if entity_entry is None or entity_entry.config_entry_id is None:
+        return None
+    return hass.data.get(DOMAIN, {}).get(entity_entry.config_entry_id)
+
 
-async def _get_unit_id_from_entity(hass: HomeAssistant, entity_id: str, coordinator: SystemairUpdateCoordinator) -> str | None:
+@callback
+def _get_unit_id_from_entity(hass: HomeAssistant, entity_id: str, coordinator: SystemairUpdateCoordinator) -> str | None:
     """Get the unit ID from an entity ID."""
+    if (unit_id := coordinator.entity_to_unit.get(entity_id)) is not None:
+        return unit_id
+    
     entity_registry = async_get_entity_registry(hass)
     entity_entry = entity_registry.async_get(entity_id)
     if entity_entry is None or entity_entry.device_id is None:
@@ -46,25 +57,68 @@ async def _get_unit_id_from_entity(hass: HomeAssistant, entity_id: str, coordina
         return None
     
     # Look for the SystemAIR identifier in the device identifiers
-    for identifier in device_entry.identifiers:
-        if identifier[0] == DOMAIN:
-            unit_id = identifier[1]
-            if unit_id in coordinator.units:
-                return unit_id
+    unit_id = next((identifier[1] for identifier in device_entry.identifiers if identifier[0] == DOMAIN), None)
+    if unit_id is None or unit_id not in coordinator.units:
+        return None
+    
+    coordinator.entity_to_unit[entity_id] = unit_id
+    return unit_id
+
+
+@callback
+def _async_get_target(
+    hass: HomeAssistant, entity_id: str
+) -> tuple[SystemairUpdateCoordinator, str] | None:
+    """Get the coordinator and unit ID targeted by a service call."""
+    coordinator = _get_coordinator_for_entity(hass, entity_id)
+    if coordinator is None:
+        _LOGGER.error("No SystemAIR config entry found for entity %s", entity_id)
+        return None
+    
+    # Get the unit ID from the entity ID
+    unit_id = _get_unit_id_from_entity(hass, entity_id, coordinator)
+    if unit_id is None:
+        _LOGGER.error("No ventilation unit found for entity %s", entity_id)
+        return None
     
-    return None
+    return coordinator, unit_id
+
+
+async def _async_handle_unit_setter(
+    hass: HomeAssistant,
+    method_name: str,
+    arg_keys: tuple[str, ...],
+    call: ServiceCall,
+) -> None:
+    """Handle a service call that passes call data to a coordinator setter."""
+    if (target := _async_get_target(hass, call.data["entity_id"])) is None:
+        return
+    coordinator, unit_id = target
+    args = [call.data[key] for key in arg_keys]
+    
+    try:
+        if await getattr(coordinator, method_name)(unit_id, *args):
+            # The setter updated the unit, show it now and confirm it with a debounced poll
+            coordinator.async_notify_unit_changed(unit_id)
+            coordinator.reconcile_debouncer.async_schedule_call()
+            _LOGGER.debug("Called %s for unit %s with %s", method_name, unit_id, args)
+        else:
+            _LOGGER.warning("Failed to call %s for unit %s with %s", method_name, unit_id, args)
+    except SystemairError as err:
+        _LOGGER.error("Failed to call %s for unit %s: %s", method_name, unit_id, err)
+
 
+# Every service targets one SystemAIR entity
+_BASE_SCHEMA = vol.Schema({vol.Required("entity_id"): cv.entity_id})
 
-SET_USER_MODE_SCHEMA = vol.Schema(
+SET_USER_MODE_SCHEMA = _BASE_SCHEMA.extend(
     {
-        vol.Required("entity_id"): cv.entity_id,
-        vol.Required("mode"): vol.In(list(MODE_NAME_TO_VALUE.keys())),
+        vol.Required("mode"): vol.In(frozenset(MODE_NAME_TO_VALUE)),
     }
 )
 
-SET_MANUAL_AIRFLOW_SCHEMA = vol.Schema(
+SET_MANUAL_AIRFLOW_SCHEMA = _BASE_SCHEMA.extend(
     {
-        vol.Required("entity_id"): cv.entity_id,
         vol.Required("airflow_level"): vol.All(
             vol.Coerce(int), 
             vol.Range(min=1, max=5),
@@ -73,27 +127,36 @@ SET_MANUAL_AIRFLOW_SCHEMA = vol.Schema(
     }
 )
 
-SET_ROOM_TEMP_SETPOINT_SCHEMA = vol.Schema(
+SET_ROOM_TEMP_SETPOINT_SCHEMA = _BASE_SCHEMA.extend(
     {
-        vol.Required("entity_id"): cv.entity_id,
         vol.Required("temperature"): vol.All(vol.Coerce(float), vol.Range(min=12, max=28)),
     }
 )
 
-SET_USER_MODE_TIME_SCHEMA = vol.Schema(
+SET_USER_MODE_TIME_SCHEMA = _BASE_SCHEMA.extend(
     {
-        vol.Required("entity_id"): cv.entity_id,
-        vol.Required("mode"): vol.In(["holiday", "away", "fireplace", "refresh", "crowded"]),
+        vol.Required("mode"): vol.In(_TIMED_MODE_NAMES),
         vol.Required("time"): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
     }
 )
 
+# Services that only pass values of the call data on to a coordinator setter,
+# with the setter and the call data keys of its arguments
+_UNIT_SETTER_SERVICES = (
+    # Airflow level: 1 = Off, 2 = Low, 3 = Normal, 4 = High, 5 = Refresh
+    (SERVICE_SET_MANUAL_AIRFLOW, SET_MANUAL_AIRFLOW_SCHEMA, "async_set_fan_speed", ("airflow_level",)),
+    (SERVICE_SET_ROOM_TEMP_SETPOINT, SET_ROOM_TEMP_SETPOINT_SCHEMA, "async_set_temperature", ("temperature",)),
+)
+
 
-async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Set up the SystemAIR services."""
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up the SystemAIR services.
+    
+    Called once from async_setup. Services are shared by all config entries,
+    the coordinator is looked up from the target entity on every call.
+    """
     try:
-        coordinator: SystemairUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-        _LOGGER.debug(f"Setting up SystemAIR services with coordinator: {coordinator}")
+        _LOGGER.debug("Setting up SystemAIR services")
 
         async def async_handle_set_user_mode(call: ServiceCall) -> None:
             """Handle the set_user_mode service call."""
@@ -101,16 +164,10 @@ async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
             mode_name = call.data["mode"]
             mode_value = MODE_NAME_TO_VALUE[mode_name]
             
-            # Get the unit ID from the entity ID
-            unit_id = await _get_unit_id_from_entity(hass, entity_id, coordinator)
-            if unit_id is None:
-                _LOGGER.error(f"No ventilation unit found for entity {entity_id}")
-                return
-            
-            unit = coordinator.units.get(unit_id)
-            if unit is None:
-                _LOGGER.error(f"Unit {unit_id} not found in coordinator")
+            if (target := _async_get_target(hass, entity_id)) is None:
                 return
+            coordinator, unit_id = target
+            unit = coordinator.units[unit_id]
             
             try:
                 # For timed modes, get the mode key for looking up stored values
@@ -124,98 +181,31 @@ async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
                     stored_time = unit.user_mode_times.get(mode_key)
                     if stored_time is not None:
                         time_minutes = stored_time
-                        _LOGGER.debug(f"Using locally stored time for {mode_name} mode: {time_minutes} minutes")
+                        _LOGGER.debug("Using locally stored time for %s mode: %s minutes", mode_name, time_minutes)
                 
                 # If no stored value, fall back to configuration defaults
                 if time_minutes is None:
-                    # Map mode value to config key for durations
-                    mode_to_duration_config = {
-                        UserModes.HOLIDAY: CONF_DURATION_HOLIDAY,
-                        UserModes.AWAY: CONF_DURATION_AWAY,
-                        UserModes.FIREPLACE: CONF_DURATION_FIREPLACE,
-                        UserModes.REFRESH: CONF_DURATION_REFRESH,
-                        UserModes.CROWDED: CONF_DURATION_CROWDED,
-                    }
-                    
                     # If the mode is a timed mode, get the default duration from config
-                    duration_config_key = mode_to_duration_config.get(mode_value)
-                    if duration_config_key and duration_config_key in entry.data:
+                    duration_config_key = MODE_TO_DURATION_KEY.get(mode_value)
+                    entry = coordinator.config_entry
+                    if duration_config_key and entry and duration_config_key in entry.data:
                         config_value = entry.data.get(duration_config_key)
                         time_minutes = convert_duration_to_minutes(duration_config_key, config_value)
-                        _LOGGER.debug(f"Using default config duration for {mode_name} mode: {time_minutes} minutes (from {config_value} {duration_config_key.split('_')[-1]})")
+                        _LOGGER.debug("Using default config duration for %s mode: %s minutes (from %s %s)", mode_name, time_minutes, config_value, DURATION_UNITS[duration_config_key])
                 
                 # Set the mode with duration if applicable
-                # The coordinator's set_mode_with_time will use locally stored time
+                # The coordinator's async_set_mode_with_time will use locally stored time
                 # if time_minutes is None
-                result = await hass.async_add_executor_job(
-                    coordinator.set_mode_with_time, unit_id, mode_value, time_minutes
-                )
+                result = await coordinator.async_set_mode_with_time(unit_id, mode_value, time_minutes)
                 
                 if result:
-                    _LOGGER.debug(f"Set unit {unit_id} to mode {mode_name} ({mode_value}) with time {time_minutes} minutes")
+                    coordinator.async_notify_unit_changed(unit_id)
+                    _LOGGER.debug("Set unit %s to mode %s (%s) with time %s minutes", unit_id, mode_name, mode_value, time_minutes)
                 else:
-                    _LOGGER.warning(f"Failed to set unit {unit_id} to mode {mode_name}")
+                    _LOGGER.warning("Failed to set unit %s to mode %s", unit_id, mode_name)
                     
             except SystemairError as err:
-                _LOGGER.error(f"Failed to set user mode: {err}")
-
-        async def async_handle_set_manual_airflow(call: ServiceCall) -> None:
-            """Handle the set_manual_airflow service call.
-            
-            Sets the airflow level according to these values:
-            1 = Off (0%)
-            2 = Low (25%)
-            3 = Normal (50%)
-            4 = High (75%)
-            5 = Refresh (100%)
-            """
-            entity_id = call.data["entity_id"]
-            airflow_level = call.data["airflow_level"]
-            
-            # Get the unit ID from the entity ID
-            unit_id = await _get_unit_id_from_entity(hass, entity_id, coordinator)
-            if unit_id is None:
-                _LOGGER.error(f"No ventilation unit found for entity {entity_id}")
-                return
-            
-            unit = coordinator.units.get(unit_id)
-            if unit is None:
-                _LOGGER.error(f"Unit {unit_id} not found in coordinator")
-                return
-            
-            try:
-                await hass.async_add_executor_job(
-                    coordinator.set_fan_speed, unit_id, airflow_level
-                )
-                await coordinator.async_request_refresh()
-                _LOGGER.debug(f"Set unit {unit_id} airflow level to {airflow_level}")
-            except SystemairError as err:
-                _LOGGER.error(f"Failed to set manual airflow: {err}")
-
-        async def async_handle_set_room_temp_setpoint(call: ServiceCall) -> None:
-            """Handle the set_room_temp_setpoint service call."""
-            entity_id = call.data["entity_id"]
-            temperature = call.data["temperature"]
-            
-            # Get the unit ID from the entity ID
-            unit_id = await _get_unit_id_from_entity(hass, entity_id, coordinator)
-            if unit_id is None:
-                _LOGGER.error(f"No ventilation unit found for entity {entity_id}")
-                return
-            
-            unit = coordinator.units.get(unit_id)
-            if unit is None:
-                _LOGGER.error(f"Unit {unit_id} not found in coordinator")
-                return
-            
-            try:
-                await hass.async_add_executor_job(
-                    coordinator.set_temperature, unit_id, temperature
-                )
-                await coordinator.async_request_refresh()
-                _LOGGER.debug(f"Set unit {unit_id} temperature setpoint to {temperature}")
-            except SystemairError as err:
-                _LOGGER.error(f"Failed to set temperature setpoint: {err}")
+                _LOGGER.error("Failed to set user mode: %s", err)
 
         async def async_handle_set_user_mode_time(call: ServiceCall) -> None:
             """Handle the set_user_mode_time service call.
@@ -227,46 +217,38 @@ async def async_setup_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
             mode = call.data["mode"]
             time_value = call.data["time"]
             
-            # Get the unit ID from the entity ID
-            unit_id = await _get_unit_id_from_entity(hass, entity_id, coordinator)
-            if unit_id is None:
-                _LOGGER.error(f"No ventilation unit found for entity {entity_id}")
-                return
-            
-            unit = coordinator.units.get(unit_id)
-            if unit is None:
-                _LOGGER.error(f"Unit {unit_id} not found in coordinator")
+            if (target := _async_get_target(hass, entity_id)) is None:
                 return
+            coordinator, unit_id = target
             
             try:
                 # Store the time value locally - does not send to device
-                result = await hass.async_add_executor_job(
-                    coordinator.set_user_mode_time, unit_id, mode, time_value
-                )
+                result = coordinator.async_set_user_mode_time(unit_id, mode, time_value)
                 
                 if result:
-                    _LOGGER.debug(f"Stored {mode} mode time as {time_value} minutes for unit {unit_id}")
-                    _LOGGER.debug(f"This value will be used the next time {mode} mode is activated")
+                    _LOGGER.debug("Stored %s mode time as %s minutes for unit %s", mode, time_value, unit_id)
+                    _LOGGER.debug("This value will be used the next time %s mode is activated", mode)
                 else:
-                    _LOGGER.warning(f"Failed to store {mode} mode time locally")
+                    _LOGGER.warning("Failed to store %s mode time locally", mode)
                     
             except SystemairError as err:
-                _LOGGER.error(f"Failed to store user mode time locally: {err}")
+                _LOGGER.error("Failed to store user mode time locally: %s", err)
 
         # Register services
         hass.services.async_register(
             DOMAIN, SERVICE_SET_USER_MODE, async_handle_set_user_mode, schema=SET_USER_MODE_SCHEMA
         )
-        hass.services.async_register(
-            DOMAIN, SERVICE_SET_MANUAL_AIRFLOW, async_handle_set_manual_airflow, schema=SET_MANUAL_AIRFLOW_SCHEMA
-        )
-        hass.services.async_register(
-            DOMAIN, SERVICE_SET_ROOM_TEMP_SETPOINT, async_handle_set_room_temp_setpoint, schema=SET_ROOM_TEMP_SETPOINT_SCHEMA
-        )
+        for service, schema, method_name, arg_keys in _UNIT_SETTER_SERVICES:
+            hass.services.async_register(
+                DOMAIN,
+                service,
+                partial(_async_handle_unit_setter, hass, method_name, arg_keys),
+                schema=schema,
+            )
         hass.services.async_register(
             DOMAIN, SERVICE_SET_USER_MODE_TIME, async_handle_set_user_mode_time, schema=SET_USER_MODE_TIME_SCHEMA
         )
         
         _LOGGER.debug("Successfully registered all SystemAIR services")
     except Exception as e:
-        _LOGGER.error(f"Error setting up SystemAIR services: {e}")
\ No newline at end of file
+        _LOGGER.error("Error setting up SystemAIR services: %s", e)
\ No newline at end of file